@@ -41,16 +41,49 @@ class CalibrationData:
         self.modified_at = datetime.now().isoformat()
         self.quality_score = 0.0  # R² für Multi-Point
         self.is_active = True
+        self._fit_key = None  # Cache-Schlüssel für _fit_coefficients
+        self._fit_coeffs = None
+
+    def _fit_coefficients(self) -> np.ndarray:
+        """
+        Berechnet Polynom-Koeffizienten für Punkt-Kalibrierungen (gecached)
+
+        Returns:
+            Koeffizienten für np.polyval (höchster Grad zuerst)
+        """
+        key = (self.calibration_type, tuple(map(tuple, self.reference_points)))
+        if self._fit_key == key:
+            return self._fit_coeffs
+
+        pts = np.asarray(self.reference_points, dtype=np.float64).reshape(-1, 2)
+
+        if self.calibration_type == "two_point":
+            # Geschlossene Form durch die zwei kleinsten Messwerte (kein polyfit)
+            order = np.argsort(pts[:, 0], kind="stable")
+            (x0, y0), (x1, y1) = pts[order[0]], pts[order[1]]
+            if x1 != x0:
+                slope = (y1 - y0) / (x1 - x0)
+                coeffs = np.array([slope, y0 - slope * x0])
+            else:
+                coeffs = np.array([1.0, 0.0])
+        else:
+            # Polynom-Fit (Grad = min(3, anzahl_punkte - 1))
+            degree = min(3, len(pts) - 1)
+            coeffs = np.polyfit(pts[:, 0], pts[:, 1], degree)
+
+        self._fit_key = key
+        self._fit_coeffs = coeffs
+        return coeffs
 
     def apply(self, raw_value: float) -> float:
         """
         Wendet Kalibrierung auf Rohwert an
 
         Args:
-            raw_value: Ungekalibrierter Sensorwert
+            raw_value: Ungekalibrierter Sensorwert (oder np.ndarray mit mehreren Werten)
 
         Returns:
-            Kalibrierter Wert
+            Kalibrierter Wert (np.ndarray bei Array-Eingabe)
         """
         if not self.is_active:
             return raw_value
@@ -59,38 +92,13 @@ class CalibrationData:
             # Einfache Formel: calibrated = (raw + offset) * factor
             return (raw_value + self.offset) * self.factor
 
-        elif self.calibration_type == "two_point":
-            # 2-Punkt-Kalibrierung (linear interpolation)
-            if len(self.reference_points) < 2:
-                return raw_value
-
-            # Sortiere Punkte nach gemessenem Wert
-            points = sorted(self.reference_points, key=lambda p: p[0])
-            measured1, reference1 = points[0]
-            measured2, reference2 = points[1]
-
-            # Lineare Interpolation
-            if measured2 != measured1:
-                slope = (reference2 - reference1) / (measured2 - measured1)
-                return reference1 + slope * (raw_value - measured1)
-            else:
-                return raw_value
-
-        elif self.calibration_type == "multi_point":
-            # Multi-Point-Kalibrierung (Polynom-Fit)
+        elif self.calibration_type in ("two_point", "multi_point"):
+            # 2-Punkt (lineare Interpolation) bzw. Multi-Point (Polynom-Fit)
             if len(self.reference_points) < 2:
                 return raw_value
 
-            # Extrahiere X (gemessen) und Y (referenz)
-            measured_values = [p[0] for p in self.reference_points]
-            reference_values = [p[1] for p in self.reference_points]
-
-            # Fit Polynom (Grad = min(3, anzahl_punkte - 1))
-            degree = min(3, len(self.reference_points) - 1)
-            coeffs = np.polyfit(measured_values, reference_values, degree)
-            poly = np.poly1d(coeffs)
-
-            return float(poly(raw_value))
+            calibrated = np.polyval(self._fit_coefficients(), raw_value)
+            return float(calibrated) if np.ndim(calibrated) == 0 else calibrated
 
         return raw_value
 
@@ -109,11 +117,15 @@ class CalibrationData:
             return 0.0
 
         # Berechne R² für gegebene Punkte
-        measured_values = np.array([p[0] for p in self.reference_points])
-        reference_values = np.array([p[1] for p in self.reference_points])
+        pts = np.asarray(self.reference_points, dtype=np.float64).reshape(-1, 2)
+        measured_values = pts[:, 0]
+        reference_values = pts[:, 1]
 
-        # Wende Kalibrierung an
-        calibrated_values = np.array([self.apply(m) for m in measured_values])
+        # Wende Kalibrierung an (ein Fit, vektorisiert ausgewertet)
+        if self.is_active:
+            calibrated_values = np.polyval(self._fit_coefficients(), measured_values)
+        else:
+            calibrated_values = measured_values
 
         # Berechne R²
         ss_res = np.sum((reference_values - calibrated_values) ** 2)
@@ -163,11 +175,24 @@ class CalibrationManager:
     Manager für Sensor-Kalibrierungen
     """
 
+    _instance: Optional['CalibrationManager'] = None
+
     def __init__(self, calibration_file: str = "sensor_calibrations.json"):
         self.calibration_file = calibration_file
         self.calibrations: Dict[str, CalibrationData] = {}
         self.load_calibrations()
 
+    @classmethod
+    def instance(cls) -> 'CalibrationManager':
+        """
+        Gibt gemeinsame Instanz mit Standard-Datei zurück
+
+        Die Kalibrierungs-Datei wird nur beim ersten Aufruf gelesen.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def load_calibrations(self) -> bool:
         """Lädt Kalibrierungen aus Datei"""
         if not os.path.exists(self.calibration_file):
@@ -489,23 +514,18 @@ class CalibrationManager:
                 'message': 'Keine Test-Punkte angegeben'
             }
 
-        # Validiere jeden Punkt
-        errors = []
-        relative_errors = []
-
-        for measured, expected in test_points:
-            calibrated = cal.apply(measured)
-            error = abs(calibrated - expected)
-            errors.append(error)
+        # Validiere alle Punkte auf einmal
+        pts = np.asarray(test_points, dtype=np.float64).reshape(-1, 2)
+        measured, expected = pts[:, 0], pts[:, 1]
 
-            if expected != 0:
-                rel_error = (error / abs(expected)) * 100
-                relative_errors.append(rel_error)
+        errors = np.abs(cal.apply(measured) - expected)
+        nonzero = expected != 0
+        relative_errors = errors[nonzero] / np.abs(expected[nonzero]) * 100
 
         # Statistiken
         mean_error = float(np.mean(errors))
         max_error = float(np.max(errors))
-        mean_rel_error = float(np.mean(relative_errors)) if relative_errors else 0.0
+        mean_rel_error = float(np.mean(relative_errors)) if relative_errors.size else 0.0
 
         # Bewertung
         if mean_rel_error < 1:
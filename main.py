@@ -152,6 +152,7 @@ class MainWindow(QMainWindow):
         self.data_handlers = []
         self.sequences = {}
         self.dashboard_layouts = {}
+        self._connection_status = None  # (verbunden, Port) aus update_status
         self.db = Database(db_file="arduino_tests.db")
         self.db_thread = QThread(); self.db_worker = DatabaseWorker(db_file="arduino_tests.db")
         self.db_worker.moveToThread(self.db_thread); self.db_thread.start()
@@ -722,8 +723,8 @@ class MainWindow(QMainWindow):
         # --- Sequence ---
         self.seq_runner.command_signal.connect(self.send_command)
         self.seq_runner.step_update.connect(self.sequence_tab.update_sequence_info)
-        if hasattr(self.dashboard_tab, 'sequence_info_widget'): # Prüfen ob Widget existiert
-            self.seq_runner.step_update.connect(self.dashboard_tab.sequence_info_widget.update_sequence_info)
+        # Dashboard-Widgets werden erst bei Bedarf erstellt; Verbindung beim Erstellen herstellen
+        self.dashboard_tab.on_widget_created('sequence_info', lambda widget: self.seq_runner.step_update.connect(widget.update_sequence_info))
         self.seq_runner.step_highlight_signal.connect(self.sequence_tab.highlight_step)
         self.seq_runner.finished.connect(self.sequence_finished)
         self.pin_update_for_runner.connect(self.seq_runner.on_pin_update)
@@ -761,8 +762,10 @@ class MainWindow(QMainWindow):
         self.dashboard_tab.refresh_ports_requested.connect(self.refresh_ports)
         self.dashboard_tab.start_sequence_signal.connect(self.start_sequence)
         self.dashboard_tab.start_test_run_signal.connect(self.start_test_run)
-        if hasattr(self.dashboard_tab, 'live_chart_widget'):
-             self.dashboard_tab.live_chart_widget.clear_button_pressed.connect(self.clear_chart)
+        self.dashboard_tab.on_widget_created('live_chart', lambda widget: widget.clear_button_pressed.connect(self.clear_chart))
+        # Später erstellte Widgets mit dem aktuellen Stand füllen
+        self.dashboard_tab.on_widget_created('quick_sequence', lambda widget: widget.update_sequences(self.sequences))
+        self.dashboard_tab.on_widget_created('connection', self._init_dashboard_connection_widget)
         self.dashboard_tab.layout_save_requested.connect(self.save_dashboard_layout)
         self.dashboard_tab.layout_delete_requested.connect(self.delete_dashboard_layout)
         self.dashboard_tab.layout_load_requested.connect(self.load_dashboard_layout)
@@ -1225,11 +1228,9 @@ class MainWindow(QMainWindow):
                 mode = command.get('mode')
                 if pin and mode:
                     self.pin_overview_tab.update_pin_mode(pin, mode)
-                    try:
-                        if hasattr(self.dashboard_tab, 'pin_overview_widget'):
-                            self.dashboard_tab.pin_overview_widget.update_pin_mode(pin, mode)
-                    except AttributeError:
-                        pass
+                    pin_overview = self.dashboard_tab.get_widget_if_created('pin_overview')
+                    if pin_overview is not None:
+                        pin_overview.update_pin_mode(pin, mode)
 
                     # NEU: Track Pin-Zugriff
                     if self.pin_tracker:
@@ -1273,7 +1274,7 @@ class MainWindow(QMainWindow):
                 logger.error(f"Fehler bei Konvertierung von Befehl '{command}': {e}", exc_info=True)
 
 
-    def handle_data(self, data): # Unverändert von letzter Version
+    def handle_data(self, data):
          msg_type = data.get("type")
          if msg_type == "response":
              if data.get("status") == "ok":
@@ -1286,35 +1287,34 @@ class MainWindow(QMainWindow):
                  self.pin_control_tab.update_pin_value(pin, value)
                  self.pin_overview_tab.update_pin_state(pin, value)
                  self.chart_tab.add_data_point(pin, value, current_time)
-                 try:
-                     self.dashboard_tab.pin_overview_widget.update_pin_state(pin, value)
-                     self.dashboard_tab.live_chart_widget.add_data_point(pin, value, current_time)
-                 except AttributeError: pass
+                 # Nur bereits erstellte Dashboard-Widgets aktualisieren; Attributzugriff würde verborgene Widgets anlegen
+                 pin_overview = self.dashboard_tab.get_widget_if_created('pin_overview')
+                 if pin_overview is not None: pin_overview.update_pin_state(pin, value)
+                 live_chart = self.dashboard_tab.get_widget_if_created('live_chart')
+                 if live_chart is not None: live_chart.add_data_point(pin, value, current_time)
                  self.pin_update_for_runner.emit(pin, value)
          elif msg_type == "sensor_update":
              if self.current_test_id is not None: data['time_ms'] = (time.time() - self.test_start_time) * 1000; self.sensor_log.append(data)
              self.sensor_tab.handle_sensor_data(data)
-             try:
-                 if data.get("sensor") == "B24_TEMP": self.dashboard_tab.sensor_display_widget.update_temperature(data.get("value", 0))
-                 elif data.get("sensor") == "B24_HUMIDITY": self.dashboard_tab.sensor_display_widget.update_humidity(data.get("value", 0))
-             except AttributeError as e:
-                 logger.warning(f"Dashboard sensor widget nicht verfügbar: {e}")
+             sensor_display = self.dashboard_tab.get_widget_if_created('sensor_display')
+             if sensor_display is not None:
+                 if data.get("sensor") == "B24_TEMP": sensor_display.update_temperature(data.get("value", 0))
+                 elif data.get("sensor") == "B24_HUMIDITY": sensor_display.update_humidity(data.get("value", 0))
          for handler in self.data_handlers:
              try: handler(data)
              except Exception as e:
                  logger.error(f"Handler {handler.__name__ if hasattr(handler, '__name__') else handler} failed: {e}", exc_info=True)
 
 
-    def update_status(self, message): # Unverändert von letzter Version
+    def update_status(self, message):
          self.status_bar.showMessage(message)
          is_connected = "Verbunden" in message or "Simulation" in message
          port_name = ""
          if is_connected: port_name = message.split(':')[1].strip() if ':' in message else ("Simulation" if "Simulation" in message else "")
-         try:
-             self.dashboard_tab.connection_widget.update_status(is_connected, port_name)
-             self.dashboard_tab.activity_widget.add_entry(message)
-         except AttributeError as e:
-             logger.debug(f"Dashboard connection/activity widget nicht verfügbar: {e}")
+         self._connection_status = (is_connected, port_name)
+         connection = self.dashboard_tab.get_widget_if_created('connection')
+         if connection is not None: connection.update_status(is_connected, port_name)
+         self._add_dashboard_activity(message)
 
     def _update_quick_connect_button(self, status_message):
         """Aktualisiert den Quick Connect Button basierend auf dem Verbindungsstatus."""
@@ -1362,7 +1362,7 @@ class MainWindow(QMainWindow):
         if not config: return
         self.sequences = config.get("sequences", {})
         self.sequence_tab.update_sequence_list(self.sequences)
-        if hasattr(self.dashboard_tab, 'quick_sequence_widget'): self.dashboard_tab.quick_sequence_widget.update_sequences(self.sequences)
+        self._update_dashboard_sequences()
         self.pin_control_tab.set_pin_configs(config.get("pin_configs", {}))
         self.dashboard_layouts = config.get("dashboard_layouts", {})
         if "Standard" not in self.dashboard_layouts and hasattr(self.dashboard_tab, 'get_current_layout_config'):
@@ -1415,21 +1415,37 @@ class MainWindow(QMainWindow):
 
     # --- Andere Methoden (clear_chart, sequence_finished, start/stop sequence/test, etc.) ---
     # bleiben weitgehend unverändert, ggf. Prüfungen auf hasattr hinzufügen
-    def clear_chart(self): # Unverändert
+    def clear_chart(self):
         self.chart_tab.clear()
-        try: self.dashboard_tab.live_chart_widget.clear()
-        except AttributeError: pass
+        live_chart = self.dashboard_tab.get_widget_if_created('live_chart')
+        if live_chart is not None: live_chart.clear()
         self.chart_start_time = time.time()
         self.status_bar.showMessage("Live-Diagramme zurückgesetzt.", 2000)
 
-    def sequence_finished(self, cycles, status, event_log): # Unverändert von letzter Version
+    def _init_dashboard_connection_widget(self, widget):
+        """Übernimmt Portliste und letzten Verbindungsstatus in ein neu erstelltes Verbindungs-Widget."""
+        widget.update_ports([self.port_combo.itemText(i) for i in range(self.port_combo.count())])
+        if self._connection_status is not None: widget.update_status(*self._connection_status)
+
+    def _update_dashboard_sequences(self):
+        """Aktualisiert die Schnellstart-Sequenzen, sofern das Dashboard-Widget bereits erstellt wurde."""
+        quick_sequence = self.dashboard_tab.get_widget_if_created('quick_sequence')
+        if quick_sequence is not None: quick_sequence.update_sequences(self.sequences)
+
+    def _add_dashboard_activity(self, message):
+        """Trägt eine Meldung in das Aktivitäten-Widget ein, sofern es bereits erstellt wurde."""
+        activity = self.dashboard_tab.get_widget_if_created('activity')
+        if activity is not None: activity.add_entry(message)
+
+    def sequence_finished(self, cycles, status, event_log):
         self.sequence_tab.set_running_state(False); self.sequence_tab.highlight_step(-1)
-        if hasattr(self.dashboard_tab, 'sequence_info_widget'): self.dashboard_tab.sequence_info_widget.set_stopped_state()
-        if hasattr(self.dashboard_tab, 'activity_widget'): self.dashboard_tab.activity_widget.add_entry(f"Sequenz beendet: {status}")
+        sequence_info = self.dashboard_tab.get_widget_if_created('sequence_info')
+        if sequence_info is not None: sequence_info.set_stopped_state()
+        self._add_dashboard_activity(f"Sequenz beendet: {status}")
         if event_log:
             analysis = TrendAnalyzer.analyze_timing(event_log)
             self.sequence_tab.update_trend_info(analysis)
-            if hasattr(self.dashboard_tab, 'sequence_info_widget'): self.dashboard_tab.sequence_info_widget.update_trend_info(analysis)
+            if sequence_info is not None: sequence_info.update_trend_info(analysis)
         if self.current_test_id:
             sensor_stats = {};
             temps = [s['value'] for s in self.sensor_log if s.get('sensor') == 'B24_TEMP' and s.get('value') is not None]
@@ -1457,8 +1473,7 @@ class MainWindow(QMainWindow):
             self.live_stats_widget.start_monitoring(cycles)
             logger.info(f"Live-Stats gestartet für Sequenz '{seq_name}' mit {cycles} Zyklen")
 
-        if hasattr(self.dashboard_tab, 'activity_widget'):
-            self.dashboard_tab.activity_widget.add_entry(f"Sequenz '{seq_name}' gestartet.")
+        self._add_dashboard_activity(f"Sequenz '{seq_name}' gestartet.")
 
         self.sequence_tab.set_running_state(True)
         self.seq_runner.start_sequence(self.sequences[seq_id])
@@ -1490,8 +1505,7 @@ class MainWindow(QMainWindow):
         self.test_start_time = time.time()
         self.sensor_log.clear()
 
-        if hasattr(self.dashboard_tab, 'activity_widget'):
-            self.dashboard_tab.activity_widget.add_entry(f"Testlauf '{name}' gestartet.")
+        self._add_dashboard_activity(f"Testlauf '{name}' gestartet.")
 
         self.sequence_tab.set_running_state(True)
         self.seq_runner.start_sequence(seq)
@@ -1499,23 +1513,23 @@ class MainWindow(QMainWindow):
     def on_sequence_updated_from_editor(self, seq_id, updated_data): # Unverändert
         if seq_id in self.sequences: self.sequences[seq_id].update(updated_data); self.sequence_tab.update_sequence_list(self.sequences); self.auto_save_config()
 
-    def new_sequence(self): # Unverändert
+    def new_sequence(self):
         dialog = SequenceDialog(self)
         if dialog.exec():
             seq = dialog.get_sequence();
             if not seq["name"]: QMessageBox.warning(self, "Fehler", "Eine Sequenz benötigt einen Namen!"); return
             seq_id = str(uuid.uuid4()); self.sequences[seq_id] = seq; self.sequence_tab.update_sequence_list(self.sequences)
-            if hasattr(self.dashboard_tab, 'quick_sequence_widget'): self.dashboard_tab.quick_sequence_widget.update_sequences(self.sequences)
+            self._update_dashboard_sequences()
             self.auto_save_config()
 
     def edit_sequence(self, seq_id): # Unverändert
         if seq_id in self.sequences: self.sequence_tab.open_visual_editor_for_sequence(seq_id, self.sequences[seq_id])
 
-    def delete_sequence(self, seq_id): # Unverändert
+    def delete_sequence(self, seq_id):
         reply = QMessageBox.question(self, "Löschen", f"Soll die Sequenz '{self.sequences[seq_id]['name']}' wirklich gelöscht werden?")
         if reply == QMessageBox.StandardButton.Yes:
             del self.sequences[seq_id]; self.sequence_tab.update_sequence_list(self.sequences)
-            if hasattr(self.dashboard_tab, 'quick_sequence_widget'): self.dashboard_tab.quick_sequence_widget.update_sequences(self.sequences)
+            self._update_dashboard_sequences()
             self.auto_save_config()
 
     def toggle_favorite(self, seq_id):
@@ -1524,8 +1538,7 @@ class MainWindow(QMainWindow):
             current = self.sequences[seq_id].get("favorite", False)
             self.sequences[seq_id]["favorite"] = not current
             self.sequence_tab.update_sequence_list(self.sequences)
-            if hasattr(self.dashboard_tab, 'quick_sequence_widget'):
-                self.dashboard_tab.quick_sequence_widget.update_sequences(self.sequences)
+            self._update_dashboard_sequences()
             self.auto_save_config()
 
             status = "als Favorit markiert" if not current else "aus Favoriten entfernt"
@@ -1669,10 +1682,11 @@ class MainWindow(QMainWindow):
     def register_data_handler(self, handler): # Unverändert
         self.data_handlers.append(handler)
 
-    def refresh_ports(self): # Unverändert
+    def refresh_ports(self):
         ports = [port.device for port in serial.tools.list_ports.comports()]
         self.port_combo.clear(); self.port_combo.addItems(ports)
-        if hasattr(self.dashboard_tab, 'connection_widget'): self.dashboard_tab.connection_widget.update_ports(ports)
+        connection = self.dashboard_tab.get_widget_if_created('connection')
+        if connection is not None: connection.update_ports(ports)
 
     def _process_command_queue(self):
         """Verarbeitet Command Queue ohne UI zu blockieren."""
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Tests für CalibrationData
+"""
+import pytest
+import numpy as np
+from core.calibration_manager import CalibrationData, CalibrationManager
+
+
+class TestCalibrationData:
+    """Test-Suite für CalibrationData"""
+
+    def test_offset_factor_apply(self):
+        """Test: Offset/Faktor-Formel"""
+        cal = CalibrationData("S1", "offset_factor", offset=1.0, factor=2.0)
+        assert cal.apply(1.0) == 4.0
+        assert cal.calculate_quality() == 1.0
+
+    def test_two_point_apply_unsorted_points(self):
+        """Test: 2-Punkt-Kalibrierung unabhängig von der Punkt-Reihenfolge"""
+        cal = CalibrationData("S1", "two_point", reference_points=[(10.0, 12.0), (0.0, 1.0)])
+        assert cal.apply(5.0) == pytest.approx(6.5)
+        assert cal.calculate_quality() == pytest.approx(1.0)
+
+    def test_two_point_identical_measurements(self):
+        """Test: Identische Messwerte liefern den Rohwert"""
+        cal = CalibrationData("S1", "two_point", reference_points=[(5.0, 1.0), (5.0, 3.0)])
+        assert cal.apply(7.0) == pytest.approx(7.0)
+
+    def test_multi_point_apply(self):
+        """Test: Multi-Point-Kalibrierung mit linearen Daten"""
+        points = [(0.0, 1.0), (1.0, 3.0), (2.0, 5.0), (3.0, 7.0)]
+        cal = CalibrationData("S1", "multi_point", reference_points=points)
+        assert cal.apply(1.5) == pytest.approx(4.0)
+        assert cal.calculate_quality() == pytest.approx(1.0)
+
+    def test_fit_cache_follows_reference_points(self):
+        """Test: Geänderte Referenzpunkte führen zu neuem Fit"""
+        cal = CalibrationData("S1", "two_point", reference_points=[(0.0, 0.0), (10.0, 10.0)])
+        assert cal.apply(5.0) == pytest.approx(5.0)
+
+        cal.reference_points[1] = (10.0, 20.0)
+        assert cal.apply(5.0) == pytest.approx(10.0)
+
+    def test_inactive_returns_raw_value(self):
+        """Test: Deaktivierte Kalibrierung gibt Rohwert zurück"""
+        cal = CalibrationData("S1", "two_point", reference_points=[(0.0, 1.0), (10.0, 21.0)])
+        cal.is_active = False
+        assert cal.apply(5.0) == 5.0
+
+    def test_apply_array_input(self):
+        """Test: apply wertet mehrere Rohwerte auf einmal aus"""
+        points = [(0.0, 1.0), (1.0, 3.0), (2.0, 5.0), (3.0, 7.0)]
+        cal = CalibrationData("S1", "multi_point", reference_points=points)
+        xs = np.array([0.0, 1.5, 3.0])
+        assert cal.apply(xs) == pytest.approx([1.0, 4.0, 7.0])
+
+        cal = CalibrationData("S1", "offset_factor", offset=1.0, factor=2.0)
+        assert cal.apply(xs) == pytest.approx([2.0, 5.0, 8.0])
+
+
+class TestCalibrationManager:
+    """Test-Suite für CalibrationManager"""
+
+    def test_instance_is_shared(self, monkeypatch):
+        """Test: instance() liefert immer dieselbe Instanz"""
+        monkeypatch.setattr(CalibrationManager, "_instance", None)
+        monkeypatch.setattr(CalibrationManager, "load_calibrations", lambda self: False)
+
+        first = CalibrationManager.instance()
+        assert CalibrationManager.instance() is first
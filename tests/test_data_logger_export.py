@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Tests für den JSON-Export des Data Loggers
+"""
+import json
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+from ui.data_logger_widget import LogEntry, write_json_export
+
+
+class TestWriteJsonExport:
+    """Test-Suite für write_json_export"""
+
+    def test_empty_entries_is_valid_json(self, temp_dir):
+        """Test: Leere Eintragsliste ergibt eine gültige leere JSON-Liste"""
+        file_path = temp_dir / "empty.json"
+        write_json_export(str(file_path), [])
+
+        content = file_path.read_text(encoding="utf-8")
+        assert content == "[]"
+        assert json.loads(content) == []
+
+    def test_roundtrip_matches_json_dump(self, temp_dir):
+        """Test: Export lässt sich laden und entspricht json.dump(indent=2)"""
+        entries = [
+            LogEntry(1700000000.123, "D2", 1, "value"),
+            LogEntry(1700000001.5, "A0", 512, "trigger", {"trigger": "A0 > 500"}),
+        ]
+        file_path = temp_dir / "log.json"
+        progress = []
+        write_json_export(str(file_path), entries, progress.append)
+
+        content = file_path.read_text(encoding="utf-8")
+        expected = [entry.to_dict() for entry in entries]
+        assert json.loads(content) == expected
+        assert content == json.dumps(expected, indent=2)
+        assert progress == [len(entries)]
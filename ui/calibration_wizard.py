@@ -5,13 +5,19 @@ Schritt-für-Schritt-Wizard für Sensor-Kalibrierung
 """
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,
-    QComboBox, QTextEdit, QGroupBox, QFormLayout, QProgressBar, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMessageBox, QDoubleSpinBox, QCheckBox
+    QComboBox, QTextEdit, QGroupBox, QFormLayout, QTableWidget,
+    QTableWidgetItem, QHeaderView, QMessageBox, QCheckBox,
+    QAbstractItemView
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QLocale
+from PyQt6.QtGui import QFont, QColor, QDoubleValidator
 from typing import Optional, List, Tuple
+import logging
 import time
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+import numpy as np
 
 try:
     from core.calibration_manager import CalibrationManager, CalibrationData
@@ -19,6 +25,115 @@ try:
 except ImportError:
     CALIBRATION_AVAILABLE = False
 
+logger = logging.getLogger("ArduinoPanel.CalibrationWizard")
+
+# Nach so vielen Fehlern in Folge wird das Live-Polling gestoppt
+MAX_POLL_ERRORS = 20
+
+
+# Beschreibungen der Kalibrierungs-Typen (Schritt 1), von allen Wizards geteilt
+_TYPE_DESC = MappingProxyType({
+    "two_point": """
+<b>2-Punkt-Kalibrierung:</b>
+<p>Sie messen bei zwei bekannten Referenzwerten (z.B. Eis-Wasser = 0°C und kochendes Wasser = 100°C).
+Daraus wird eine lineare Korrektur berechnet.</p>
+<p><b>Vorteile:</b> Einfach, schnell, für die meisten Sensoren ausreichend<br>
+<b>Geeignet für:</b> Temperatur, Luftfeuchtigkeit, Druck</p>
+    """,
+    "offset_factor": """
+<b>Offset/Faktor-Kalibrierung:</b>
+<p>Sie geben manuell einen Offset (Verschiebung) und Faktor (Multiplikator) ein.
+Formel: kalibriert = (gemessen + offset) × faktor</p>
+<p><b>Vorteile:</b> Sehr schnell, wenn Sie die Werte bereits kennen<br>
+<b>Geeignet für:</b> Wenn Sie Offset/Faktor aus Datenblatt haben</p>
+    """,
+    "multi_point": """
+<b>Multi-Point-Kalibrierung:</b>
+<p>Sie messen bei 3 oder mehr Referenzwerten. Ein Polynom wird gefittet für höchste Präzision.</p>
+<p><b>Vorteile:</b> Höchste Genauigkeit, korrigiert auch nicht-lineare Abweichungen<br>
+<b>Geeignet für:</b> Hochpräzise Messungen, nicht-lineare Sensoren</p>
+    """
+})
+
+# Titel der beiden Messpunkte bei 2-Punkt-Kalibrierung
+TWO_POINT_TITLES = ("📍 Messpunkt 1 (niedriger Wert)", "📍 Messpunkt 2 (hoher Wert)")
+
+
+@dataclass
+class _PointGroup:
+    """Widgets eines Messpunkts im 2-Punkt-Schritt"""
+    group: QGroupBox
+    value_label: QLabel
+    ref_edit: QLineEdit
+    capture_btn: QPushButton
+
+
+# Schritt-Anzeige
+WIZARD_STEPS = 5
+STEP_DOT_DONE_STYLE = "color: #27ae60; font-size: 16px;"
+STEP_DOT_PENDING_STYLE = "color: #bdc3c7; font-size: 16px;"
+
+# Live-Wert-Labels: Schrift einmalig als QFont, Stylesheet nur für die Farbe
+VALUE_LABEL_STYLE = "color: #3498db;"
+_VALUE_FONT: Optional[QFont] = None
+
+
+def _value_font() -> QFont:
+    """Gibt die (einmal erzeugte) Schrift für Live-Wert-Labels zurück"""
+    global _VALUE_FONT
+    if _VALUE_FONT is None:
+        # Erst nach Erzeugung der QApplication anlegen
+        _VALUE_FONT = QFont()
+        _VALUE_FONT.setPixelSize(18)
+        _VALUE_FONT.setBold(True)
+    return _VALUE_FONT
+
+
+def _make_double_edit(lo: float, hi: float, decimals: int, value: float = 0.0) -> QLineEdit:
+    """Erstellt ein schlankes Zahlen-Eingabefeld (statt QDoubleSpinBox)"""
+    edit = QLineEdit(f"{value:.{decimals}f}")
+    validator = QDoubleValidator(lo, hi, decimals, edit)
+    validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+    validator.setLocale(QLocale.c())
+    edit.setValidator(validator)
+    edit.setLocale(QLocale.c())  # Gleiches Zahlenformat wie float(): Punkt, keine Tausender
+    edit.setAlignment(Qt.AlignmentFlag.AlignRight)
+    return edit
+
+
+def _edit_value(edit: QLineEdit, default: float = 0.0) -> float:
+    """Liest Zahl aus Eingabefeld (unvollständige Eingaben -> default)"""
+    try:
+        return float(edit.text())
+    except ValueError:
+        return default
+
+
+# HTML-Vorlagen für die Zusammenfassung (Schritt 4)
+_SUMMARY_TMPL_COMMON = """
+<h3>Kalibrierung erfolgreich erstellt!</h3>
+
+<table border="1" cellpadding="5">
+<tr><td><b>Sensor:</b></td><td>{sensor_name}</td></tr>
+<tr><td><b>Typ:</b></td><td>{calibration_type}</td></tr>
+<tr><td><b>Qualität:</b></td><td>{quality_score:.3f}</td></tr>
+"""
+
+_SUMMARY_TMPL_OFFSET = """
+<tr><td><b>Offset:</b></td><td>{offset:.3f}</td></tr>
+<tr><td><b>Faktor:</b></td><td>{factor:.3f}</td></tr>
+"""
+
+_SUMMARY_TMPL_POINTS = """
+<tr><td><b>Messpunkte:</b></td><td>{num_points}</td></tr>
+"""
+
+_SUMMARY_TMPL_TAIL = """
+</table>
+
+<p><b>Die Kalibrierung wird automatisch auf alle zukünftigen Messungen angewendet.</b></p>
+"""
+
 
 class CalibrationWizard(QDialog):
     """
@@ -33,6 +148,7 @@ class CalibrationWizard(QDialog):
         sensor_id: str,
         sensor_name: str = "",
         current_value_callback=None,  # Funktion die aktuellen Sensor-Wert liefert
+        calibration_manager=None,  # Optional: bestehender CalibrationManager
         parent=None
     ):
         super().__init__(parent)
@@ -45,24 +161,29 @@ class CalibrationWizard(QDialog):
         self.sensor_id = sensor_id
         self.sensor_name = sensor_name or sensor_id
         self.current_value_callback = current_value_callback
-        self.calibration_manager = CalibrationManager()
+        self.calibration_manager = calibration_manager or CalibrationManager.instance()
 
         self.current_step = 0
         self.calibration_type = "two_point"  # Default
-        self.measurement_points = []  # [(measured, reference), ...]
+        self.measurement_points = []  # [(measured, reference), ...] bzw. (N, 2)-Array bei Multi-Point
+        self._multi_arr = None
+        self.point_widgets: List[_PointGroup] = []  # Nur im 2-Punkt-Schritt
+        self._cal_cached = None  # Zuletzt erstellte Kalibrierung
+        self._cal_dirty = True  # True wenn Eingaben seit _cal_cached geändert
         self.current_measured_value = 0.0
+        self._poll_err_count = 0  # Aufeinanderfolgende Fehler beim Sensor-Abruf
 
         self.setWindowTitle(f"Kalibrierung: {self.sensor_name}")
         self.setMinimumSize(600, 500)
         self.setModal(True)
 
-        self.setup_ui()
-        self.show_step(0)
-
-        # Timer für Live-Wert-Update
+        # Timer für Live-Wert-Update (läuft nur im Mess-Schritt, siehe show_step)
         self.update_timer = QTimer(self)
+        self.update_timer.setInterval(500)  # Update alle 500ms
         self.update_timer.timeout.connect(self.update_current_value)
-        self.update_timer.start(500)  # Update alle 500ms
+
+        self.setup_ui()
+        self.show_step(0)
 
     def setup_ui(self):
         """Erstellt die UI"""
@@ -74,11 +195,17 @@ class CalibrationWizard(QDialog):
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(header)
 
-        # Progress Bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setMaximum(4)
-        self.progress_bar.setValue(0)
-        layout.addWidget(self.progress_bar)
+        # Schritt-Anzeige (ein Punkt pro Schritt)
+        dots_layout = QHBoxLayout()
+        dots_layout.addStretch()
+        self._step_dots: List[QLabel] = []
+        for _ in range(WIZARD_STEPS):
+            dot = QLabel("●")
+            dot.setStyleSheet(STEP_DOT_PENDING_STYLE)
+            dots_layout.addWidget(dot)
+            self._step_dots.append(dot)
+        dots_layout.addStretch()
+        layout.addLayout(dots_layout)
 
         # Step Container (wird dynamisch gefüllt)
         self.step_container = QGroupBox()
@@ -114,7 +241,8 @@ class CalibrationWizard(QDialog):
                 item.widget().deleteLater()
 
         self.current_step = step
-        self.progress_bar.setValue(step)
+        for i, dot in enumerate(self._step_dots):
+            dot.setStyleSheet(STEP_DOT_DONE_STYLE if i <= step else STEP_DOT_PENDING_STYLE)
 
         # Zeige entsprechenden Schritt
         if step == 0:
@@ -128,6 +256,14 @@ class CalibrationWizard(QDialog):
         elif step == 4:
             self.show_step_summary()
 
+        # Live-Werte nur abfragen, wenn sie angezeigt werden
+        if step == 2 and self.calibration_type != "offset_factor":
+            self._poll_err_count = 0
+            self.update_timer.start()
+            self.update_current_value()
+        else:
+            self.update_timer.stop()
+
         # Update Navigation
         self.back_btn.setEnabled(step > 0)
 
@@ -172,6 +308,7 @@ um systematische Abweichungen zu korrigieren und die Messgenauigkeit zu verbesse
         self.type_combo.addItem("🎯 2-Punkt-Kalibrierung (empfohlen)", "two_point")
         self.type_combo.addItem("📏 Offset/Faktor-Kalibrierung (einfach)", "offset_factor")
         self.type_combo.addItem("📊 Multi-Point-Kalibrierung (präzise)", "multi_point")
+        self.type_combo.setCurrentIndex(max(0, self.type_combo.findData(self.calibration_type)))
         self.type_combo.currentIndexChanged.connect(self.on_type_changed)
         self.step_layout.addWidget(self.type_combo)
 
@@ -187,43 +324,18 @@ um systematische Abweichungen zu korrigieren und die Messgenauigkeit zu verbesse
 
     def on_type_changed(self):
         """Update Beschreibung wenn Typ geändert wird"""
-        cal_type = self.type_combo.currentData()
-
-        descriptions = {
-            "two_point": """
-<b>2-Punkt-Kalibrierung:</b>
-<p>Sie messen bei zwei bekannten Referenzwerten (z.B. Eis-Wasser = 0°C und kochendes Wasser = 100°C).
-Daraus wird eine lineare Korrektur berechnet.</p>
-<p><b>Vorteile:</b> Einfach, schnell, für die meisten Sensoren ausreichend<br>
-<b>Geeignet für:</b> Temperatur, Luftfeuchtigkeit, Druck</p>
-            """,
-            "offset_factor": """
-<b>Offset/Faktor-Kalibrierung:</b>
-<p>Sie geben manuell einen Offset (Verschiebung) und Faktor (Multiplikator) ein.
-Formel: kalibriert = (gemessen + offset) × faktor</p>
-<p><b>Vorteile:</b> Sehr schnell, wenn Sie die Werte bereits kennen<br>
-<b>Geeignet für:</b> Wenn Sie Offset/Faktor aus Datenblatt haben</p>
-            """,
-            "multi_point": """
-<b>Multi-Point-Kalibrierung:</b>
-<p>Sie messen bei 3 oder mehr Referenzwerten. Ein Polynom wird gefittet für höchste Präzision.</p>
-<p><b>Vorteile:</b> Höchste Genauigkeit, korrigiert auch nicht-lineare Abweichungen<br>
-<b>Geeignet für:</b> Hochpräzise Messungen, nicht-lineare Sensoren</p>
-            """
-        }
-
-        self.type_description.setHtml(descriptions.get(cal_type, ""))
+        self.calibration_type = self.type_combo.currentData()
+        self.type_description.setHtml(_TYPE_DESC.get(self.calibration_type, ""))
 
     def show_step_measurement(self):
         """Schritt 2: Messungen durchführen"""
-        cal_type = self.type_combo.currentData()
-        self.calibration_type = cal_type
+        self.invalidate_calibration()
 
-        if cal_type == "offset_factor":
+        if self.calibration_type == "offset_factor":
             self.show_step_offset_factor()
-        elif cal_type == "two_point":
+        elif self.calibration_type == "two_point":
             self.show_step_two_point()
-        elif cal_type == "multi_point":
+        elif self.calibration_type == "multi_point":
             self.show_step_multi_point()
 
     def show_step_offset_factor(self):
@@ -233,18 +345,14 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         form_layout = QFormLayout()
 
         # Offset
-        self.offset_spin = QDoubleSpinBox()
-        self.offset_spin.setRange(-10000, 10000)
-        self.offset_spin.setDecimals(3)
-        self.offset_spin.setValue(0.0)
-        form_layout.addRow("Offset:", self.offset_spin)
+        self.offset_edit = _make_double_edit(-10000, 10000, 3, 0.0)
+        self.offset_edit.textChanged.connect(self.invalidate_calibration)
+        form_layout.addRow("Offset:", self.offset_edit)
 
         # Faktor
-        self.factor_spin = QDoubleSpinBox()
-        self.factor_spin.setRange(0.001, 1000)
-        self.factor_spin.setDecimals(3)
-        self.factor_spin.setValue(1.0)
-        form_layout.addRow("Faktor:", self.factor_spin)
+        self.factor_edit = _make_double_edit(0.001, 1000, 3, 1.0)
+        self.factor_edit.textChanged.connect(self.invalidate_calibration)
+        form_layout.addRow("Faktor:", self.factor_edit)
 
         self.step_layout.addLayout(form_layout)
 
@@ -258,43 +366,13 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         """2-Punkt-Messung"""
         self.step_container.setTitle("2-Punkt-Messung durchführen")
 
-        # Punkt 1
-        point1_group = QGroupBox("📍 Messpunkt 1 (niedriger Wert)")
-        point1_layout = QFormLayout(point1_group)
-
-        self.current_value_1_label = QLabel("-- warte auf Daten --")
-        self.current_value_1_label.setStyleSheet("font-size: 18px; color: #3498db; font-weight: bold;")
-        point1_layout.addRow("Aktueller Messwert:", self.current_value_1_label)
-
-        self.reference_value_1_spin = QDoubleSpinBox()
-        self.reference_value_1_spin.setRange(-10000, 10000)
-        self.reference_value_1_spin.setDecimals(2)
-        point1_layout.addRow("Referenzwert:", self.reference_value_1_spin)
-
-        self.capture_btn_1 = QPushButton("📸 Messwert erfassen")
-        self.capture_btn_1.clicked.connect(lambda: self.capture_measurement(0))
-        point1_layout.addRow(self.capture_btn_1)
-
-        self.step_layout.addWidget(point1_group)
+        # Feste Slots für beide Messpunkte
+        self.measurement_points = [None, None]
 
-        # Punkt 2
-        point2_group = QGroupBox("📍 Messpunkt 2 (hoher Wert)")
-        point2_layout = QFormLayout(point2_group)
-
-        self.current_value_2_label = QLabel("-- warte auf Daten --")
-        self.current_value_2_label.setStyleSheet("font-size: 18px; color: #3498db; font-weight: bold;")
-        point2_layout.addRow("Aktueller Messwert:", self.current_value_2_label)
-
-        self.reference_value_2_spin = QDoubleSpinBox()
-        self.reference_value_2_spin.setRange(-10000, 10000)
-        self.reference_value_2_spin.setDecimals(2)
-        point2_layout.addRow("Referenzwert:", self.reference_value_2_spin)
-
-        self.capture_btn_2 = QPushButton("📸 Messwert erfassen")
-        self.capture_btn_2.clicked.connect(lambda: self.capture_measurement(1))
-        point2_layout.addRow(self.capture_btn_2)
-
-        self.step_layout.addWidget(point2_group)
+        self.point_widgets = [
+            self._make_point_group(i, title)
+            for i, title in enumerate(TWO_POINT_TITLES)
+        ]
 
         # Status
         self.measurement_status = QLabel("Status: Kein Messpunkt erfasst")
@@ -303,22 +381,45 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         # Weiter-Button nur wenn beide Punkte erfasst
         self.next_btn.setEnabled(False)
 
+    def _make_point_group(self, index: int, title: str) -> "_PointGroup":
+        """Erstellt die Eingabe-Gruppe für einen 2-Punkt-Messpunkt"""
+        group = QGroupBox(title)
+        group_layout = QFormLayout(group)
+
+        value_label = QLabel("-- warte auf Daten --")
+        value_label.setFont(_value_font())
+        value_label.setStyleSheet(VALUE_LABEL_STYLE)
+        group_layout.addRow("Aktueller Messwert:", value_label)
+
+        ref_edit = _make_double_edit(-10000, 10000, 2)
+        group_layout.addRow("Referenzwert:", ref_edit)
+
+        capture_btn = QPushButton("📸 Messwert erfassen")
+        capture_btn.clicked.connect(partial(self.capture_measurement, index))
+        group_layout.addRow(capture_btn)
+
+        self.step_layout.addWidget(group)
+        return _PointGroup(group, value_label, ref_edit, capture_btn)
+
     def show_step_multi_point(self):
         """Multi-Point-Messung"""
         self.step_container.setTitle("Multi-Point-Messung (min. 3 Punkte)")
 
+        # Messpunkte als (N, 2)-Array [gemessen, referenz]
+        self._multi_arr = np.empty((0, 2), dtype=np.float64)
+        self.measurement_points = self._multi_arr
+
         # Aktueller Wert
         current_group = QGroupBox("📊 Aktuelle Messung")
         current_layout = QFormLayout(current_group)
 
         self.current_value_multi_label = QLabel("-- warte auf Daten --")
-        self.current_value_multi_label.setStyleSheet("font-size: 18px; color: #3498db; font-weight: bold;")
+        self.current_value_multi_label.setFont(_value_font())
+        self.current_value_multi_label.setStyleSheet(VALUE_LABEL_STYLE)
         current_layout.addRow("Aktueller Messwert:", self.current_value_multi_label)
 
-        self.reference_value_multi_spin = QDoubleSpinBox()
-        self.reference_value_multi_spin.setRange(-10000, 10000)
-        self.reference_value_multi_spin.setDecimals(2)
-        current_layout.addRow("Referenzwert:", self.reference_value_multi_spin)
+        self.reference_value_multi_edit = _make_double_edit(-10000, 10000, 2)
+        current_layout.addRow("Referenzwert:", self.reference_value_multi_edit)
 
         self.add_point_btn = QPushButton("➕ Messpunkt hinzufügen")
         self.add_point_btn.clicked.connect(self.add_multi_point)
@@ -331,11 +432,26 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         points_layout = QVBoxLayout(points_group)
 
         self.points_table = QTableWidget()
-        self.points_table.setColumnCount(3)
-        self.points_table.setHorizontalHeaderLabels(["Gemessen", "Referenz", ""])
-        self.points_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.points_table.setColumnCount(2)
+        self.points_table.setHorizontalHeaderLabels(["Gemessen", "Referenz"])
+        # Kein Stretch-Modus: verhindert Neuberechnung aller Spaltenbreiten pro Zeile
+        header = self.points_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setDefaultSectionSize(200)
+        header.setStretchLastSection(True)
+        self.points_table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.points_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.points_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.points_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.points_table.itemSelectionChanged.connect(self.on_point_selection_changed)
         points_layout.addWidget(self.points_table)
 
+        # Ein gemeinsamer Entfernen-Button statt einem Button pro Zeile
+        self.remove_point_btn = QPushButton("🗑️ Ausgewählten Punkt entfernen")
+        self.remove_point_btn.setEnabled(False)
+        self.remove_point_btn.clicked.connect(self.remove_selected_point)
+        points_layout.addWidget(self.remove_point_btn)
+
         self.step_layout.addWidget(points_group)
 
         # Status
@@ -361,15 +477,11 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         self.validation_group = QGroupBox("Validierungs-Messung")
         validation_layout = QFormLayout(self.validation_group)
 
-        self.validation_measured_spin = QDoubleSpinBox()
-        self.validation_measured_spin.setRange(-10000, 10000)
-        self.validation_measured_spin.setDecimals(2)
-        validation_layout.addRow("Gemessener Wert:", self.validation_measured_spin)
+        self.validation_measured_edit = _make_double_edit(-10000, 10000, 2)
+        validation_layout.addRow("Gemessener Wert:", self.validation_measured_edit)
 
-        self.validation_expected_spin = QDoubleSpinBox()
-        self.validation_expected_spin.setRange(-10000, 10000)
-        self.validation_expected_spin.setDecimals(2)
-        validation_layout.addRow("Erwarteter Wert:", self.validation_expected_spin)
+        self.validation_expected_edit = _make_double_edit(-10000, 10000, 2)
+        validation_layout.addRow("Erwarteter Wert:", self.validation_expected_edit)
 
         validate_btn = QPushButton("Testen")
         validate_btn.clicked.connect(self.run_validation)
@@ -392,8 +504,8 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         # Erstelle temporäre Kalibrierung
         temp_cal = self.create_calibration_data()
 
-        measured = self.validation_measured_spin.value()
-        expected = self.validation_expected_spin.value()
+        measured = _edit_value(self.validation_measured_edit)
+        expected = _edit_value(self.validation_expected_edit)
 
         calibrated = temp_cal.apply(measured)
         error = abs(calibrated - expected)
@@ -414,6 +526,14 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
             result = f"⚠️ Fehler zu groß: {error:.2f} ({rel_error:.2f}%)"
             color = "#e74c3c"
 
+        # Residuen an allen Kalibrierpunkten (ein vektorisierter Aufruf)
+        if self.calibration_type != "offset_factor" and len(self.measurement_points) >= 2:
+            pts = np.asarray(self.measurement_points, dtype=np.float64)
+            residuals = temp_cal.apply(pts[:, 0]) - pts[:, 1]
+            max_error = float(np.max(np.abs(residuals)))
+            rms_error = float(np.sqrt(np.mean(residuals ** 2)))
+            result += f"\nKalibrierpunkte: max. Abweichung = {max_error:.2f}, RMS = {rms_error:.2f}"
+
         self.validation_result_label.setText(result)
         self.validation_result_label.setStyleSheet(f"color: {color}; font-weight: bold;")
 
@@ -424,31 +544,22 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         # Erstelle Kalibrierung
         cal_data = self.create_calibration_data()
 
-        # Zusammenfassung
-        summary_text = f"""
-<h3>Kalibrierung erfolgreich erstellt!</h3>
-
-<table border="1" cellpadding="5">
-<tr><td><b>Sensor:</b></td><td>{self.sensor_name}</td></tr>
-<tr><td><b>Typ:</b></td><td>{cal_data.calibration_type}</td></tr>
-<tr><td><b>Qualität:</b></td><td>{cal_data.quality_score:.3f}</td></tr>
-"""
-
+        # Zusammenfassung (ein Format-Durchlauf pro Abschnitt)
+        ctx = {
+            "sensor_name": self.sensor_name,
+            "calibration_type": cal_data.calibration_type,
+            "quality_score": cal_data.quality_score,
+            "offset": cal_data.offset,
+            "factor": cal_data.factor,
+            "num_points": len(cal_data.reference_points),
+        }
+        parts = [_SUMMARY_TMPL_COMMON.format_map(ctx)]
         if cal_data.calibration_type == "offset_factor":
-            summary_text += f"""
-<tr><td><b>Offset:</b></td><td>{cal_data.offset:.3f}</td></tr>
-<tr><td><b>Faktor:</b></td><td>{cal_data.factor:.3f}</td></tr>
-"""
-        elif cal_data.calibration_type in ["two_point", "multi_point"]:
-            summary_text += f"""
-<tr><td><b>Messpunkte:</b></td><td>{len(cal_data.reference_points)}</td></tr>
-"""
-
-        summary_text += """
-</table>
-
-<p><b>Die Kalibrierung wird automatisch auf alle zukünftigen Messungen angewendet.</b></p>
-        """
+            parts.append(_SUMMARY_TMPL_OFFSET.format_map(ctx))
+        elif cal_data.calibration_type in ("two_point", "multi_point"):
+            parts.append(_SUMMARY_TMPL_POINTS.format_map(ctx))
+        parts.append(_SUMMARY_TMPL_TAIL)
+        summary_text = "".join(parts)
 
         summary_label = QLabel(summary_text)
         summary_label.setWordWrap(True)
@@ -466,66 +577,90 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
         if not self.current_value_callback:
             return
 
+        # Keine Sensor-Abfrage, wenn der Wert nirgends angezeigt wird
+        if not self.isVisible() or self.current_step != 2:
+            return
+
         try:
             value = self.current_value_callback(self.sensor_id)
             self.current_measured_value = value
+            self._poll_err_count = 0
 
             # Update Labels je nach Schritt
             if self.current_step == 2:
                 if self.calibration_type == "two_point":
-                    self.current_value_1_label.setText(f"{value:.2f}")
-                    self.current_value_2_label.setText(f"{value:.2f}")
+                    text = f"{value:.2f}"
+                    for pg in self.point_widgets:
+                        pg.value_label.setText(text)
                 elif self.calibration_type == "multi_point":
                     self.current_value_multi_label.setText(f"{value:.2f}")
 
         except Exception as e:
-            print(f"Fehler beim Abrufen des Sensor-Werts: {e}")
+            self._poll_err_count += 1
+            # Nur den 1., 2., 4., 8., ... Fehler loggen (unterhalb von MAX_POLL_ERRORS), um die GUI nicht mit Ausgaben zu blockieren
+            if self._poll_err_count & (self._poll_err_count - 1) == 0:
+                logger.warning("Fehler beim Abrufen des Sensor-Werts: %s", e)
+
+            if self._poll_err_count == MAX_POLL_ERRORS:
+                self.update_timer.stop()
+                logger.error("Live-Wert-Update nach %d Fehlern gestoppt", self._poll_err_count)
+                self.show_poll_error()
+
+    def show_poll_error(self):
+        """Zeigt an, dass keine Live-Werte mehr abgerufen werden"""
+        if self.current_step != 2:
+            return
+
+        message = "⚠️ Sensor nicht erreichbar"
+        if self.calibration_type == "two_point":
+            for pg in self.point_widgets:
+                pg.value_label.setText(message)
+        elif self.calibration_type == "multi_point":
+            self.current_value_multi_label.setText(message)
 
     def capture_measurement(self, point_index: int):
         """Erfasst Messpunkt"""
         measured = self.current_measured_value
 
-        if point_index == 0:
-            reference = self.reference_value_1_spin.value()
-            self.capture_btn_1.setText(f"✅ Erfasst: {measured:.2f}")
-            self.capture_btn_1.setEnabled(False)
-        else:
-            reference = self.reference_value_2_spin.value()
-            self.capture_btn_2.setText(f"✅ Erfasst: {measured:.2f}")
-            self.capture_btn_2.setEnabled(False)
+        pg = self.point_widgets[point_index]
+        reference = _edit_value(pg.ref_edit)
+        pg.capture_btn.setText(f"✅ Erfasst: {measured:.2f}")
+        pg.capture_btn.setEnabled(False)
 
         # Speichere Punkt
-        if len(self.measurement_points) <= point_index:
-            self.measurement_points.append((measured, reference))
-        else:
-            self.measurement_points[point_index] = (measured, reference)
+        self.measurement_points[point_index] = (measured, reference)
+        self.invalidate_calibration()
 
         # Update Status
-        if len(self.measurement_points) >= 2:
+        captured = sum(p is not None for p in self.measurement_points)
+        if captured >= 2:
             self.measurement_status.setText("✅ Beide Messpunkte erfasst!")
             self.measurement_status.setStyleSheet("color: #27ae60; font-weight: bold;")
             self.next_btn.setEnabled(True)
         else:
-            self.measurement_status.setText(f"Status: {len(self.measurement_points)}/2 Messpunkte erfasst")
+            self.measurement_status.setText(f"Status: {captured}/2 Messpunkte erfasst")
 
     def add_multi_point(self):
         """Fügt Messpunkt zu Multi-Point-Liste hinzu"""
         measured = self.current_measured_value
-        reference = self.reference_value_multi_spin.value()
+        reference = _edit_value(self.reference_value_multi_edit)
 
-        self.measurement_points.append((measured, reference))
+        self._multi_arr = np.vstack([self._multi_arr, [measured, reference]])
+        self.measurement_points = self._multi_arr
+        self.invalidate_calibration()
 
-        # Füge zu Tabelle hinzu
-        row = self.points_table.rowCount()
-        self.points_table.insertRow(row)
-
-        self.points_table.setItem(row, 0, QTableWidgetItem(f"{measured:.2f}"))
-        self.points_table.setItem(row, 1, QTableWidgetItem(f"{reference:.2f}"))
+        # Füge zu Tabelle hinzu (ein Repaint am Ende statt pro Zelle)
+        self.points_table.setUpdatesEnabled(False)
+        self.points_table.blockSignals(True)
+        try:
+            row = self.points_table.rowCount()
+            self.points_table.insertRow(row)
 
-        # Delete Button
-        delete_btn = QPushButton("🗑️")
-        delete_btn.clicked.connect(lambda: self.remove_multi_point(row))
-        self.points_table.setCellWidget(row, 2, delete_btn)
+            self.points_table.setItem(row, 0, QTableWidgetItem(f"{measured:.2f}"))
+            self.points_table.setItem(row, 1, QTableWidgetItem(f"{reference:.2f}"))
+        finally:
+            self.points_table.blockSignals(False)
+            self.points_table.setUpdatesEnabled(True)
 
         # Update Status
         count = len(self.measurement_points)
@@ -537,11 +672,27 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
             self.multi_point_status.setText(f"Status: {count}/3 Messpunkte erfasst")
             self.next_btn.setEnabled(False)
 
+    def on_point_selection_changed(self):
+        """Aktiviert Entfernen-Button nur bei ausgewählter Zeile"""
+        self.remove_point_btn.setEnabled(bool(self.points_table.selectedItems()))
+
+    def remove_selected_point(self):
+        """Entfernt die aktuell ausgewählte Zeile"""
+        row = self.points_table.currentRow()
+        if row >= 0:
+            self.remove_multi_point(row)
+
     def remove_multi_point(self, row: int):
         """Entfernt Messpunkt"""
-        if row < len(self.measurement_points):
-            self.measurement_points.pop(row)
-            self.points_table.removeRow(row)
+        if row < len(self._multi_arr):
+            self._multi_arr = np.delete(self._multi_arr, row, axis=0)
+            self.measurement_points = self._multi_arr
+            self.points_table.setUpdatesEnabled(False)
+            try:
+                self.points_table.removeRow(row)
+            finally:
+                self.points_table.setUpdatesEnabled(True)
+            self.invalidate_calibration()
 
             # Update Status
             count = len(self.measurement_points)
@@ -552,31 +703,39 @@ Formel: kalibriert = (gemessen + offset) × faktor</p>
                 self.multi_point_status.setText(f"Status: {count}/3 Messpunkte erfasst")
                 self.next_btn.setEnabled(False)
 
+    def invalidate_calibration(self, *args):
+        """Markiert gecachte Kalibrierung als veraltet"""
+        self._cal_dirty = True
+
     def create_calibration_data(self) -> CalibrationData:
-        """Erstellt CalibrationData aus gesammelten Daten"""
+        """Erstellt CalibrationData aus gesammelten Daten (gecached bis sich Eingaben ändern)"""
+        if not self._cal_dirty and self._cal_cached is not None:
+            return self._cal_cached
+
         if self.calibration_type == "offset_factor":
             cal = CalibrationData(
                 sensor_id=self.sensor_id,
                 calibration_type="offset_factor",
-                offset=self.offset_spin.value(),
-                factor=self.factor_spin.value()
-            )
-
-        elif self.calibration_type == "two_point":
-            cal = CalibrationData(
-                sensor_id=self.sensor_id,
-                calibration_type="two_point",
-                reference_points=self.measurement_points
+                offset=_edit_value(self.offset_edit),
+                factor=_edit_value(self.factor_edit, 1.0)
             )
+        else:
+            if self.calibration_type == "multi_point":
+                # Array direkt übernehmen; tolist() hält die Punkte JSON-serialisierbar
+                points = self._multi_arr.tolist()
+            else:
+                points = [p for p in self.measurement_points if p is not None]
 
-        elif self.calibration_type == "multi_point":
             cal = CalibrationData(
                 sensor_id=self.sensor_id,
-                calibration_type="multi_point",
-                reference_points=self.measurement_points
+                calibration_type=self.calibration_type,
+                reference_points=points
             )
 
         cal.calculate_quality()
+
+        self._cal_cached = cal
+        self._cal_dirty = False
         return cal
 
     def go_next(self):
@@ -4,7 +4,7 @@ Dashboard Builder Module
 Drag & Drop Dashboard-Editor für Arduino Control Panel
 """
 
-from .base_widget import DashboardWidgetBase, DashboardWidgetFactory
+from .base_widget import DashboardWidgetBase, DashboardWidgetFactory, register
 from .widget_library import (
     ValueDisplayWidget,
     GaugeWidget,
@@ -18,6 +18,7 @@ from .dashboard_builder import DashboardBuilderWidget, DashboardCanvas, WidgetPa
 __all__ = [
     'DashboardWidgetBase',
     'DashboardWidgetFactory',
+    'register',
     'ValueDisplayWidget',
     'GaugeWidget',
     'LEDWidget',
@@ -5,11 +5,78 @@ Basis-Klassen für alle Dashboard-Widgets
 """
 
 from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QWidget, QMenu
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRect
-from PyQt6.QtGui import QPainter, QColor, QPen, QCursor
-from typing import Dict, Any, Optional
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QPoint, QRect, QTimer
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QCursor
+from io import StringIO
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 import uuid
 
+# Max. Rate für Drag/Resize-Updates (~60 Hz)
+MOVE_THROTTLE_MS = 16
+
+# Rahmen-Stylesheet für beide Modi; umgeschaltet wird über die Property "editMode"
+WIDGET_STYLE_TEMPLATE = """
+            DashboardWidgetBase {{
+                background-color: {background_color};
+                border: 2px solid {border_color};
+                border-radius: 6px;
+            }}
+            DashboardWidgetBase[editMode="true"] {{
+                border: 3px solid #27ae60;
+            }}
+        """
+
+# Resize-Handle (untere rechte Ecke): Größe, Randabstand, Pinsel/Stift
+HANDLE_SIZE = 12
+HANDLE_MARGIN = 3
+HANDLE_HIT_SIZE = 15  # Trefferzone etwas größer als das gezeichnete Handle
+HANDLE_BRUSH = QBrush(QColor(39, 174, 96))
+HANDLE_PEN = QPen(QColor(255, 255, 255), 1)
+
+# HTML-Export der Basis-Klasse (str.format)
+BASE_WIDGET_HTML = """
+        <div class="dashboard-widget" style="
+            width: {width}px;
+            height: {height}px;
+            background-color: {background_color};
+            border: 2px solid {border_color};
+            border-radius: 6px;
+            padding: 5px;
+        ">
+            <h3 style="color: {title_color}; text-align: center;">
+                {title}
+            </h3>
+        </div>
+        """
+
+# Platzhalter-Vorlage für Widgets, die to_html()/write_html() selbst implementieren
+PRE_RENDERED_HTML = "{html}"
+
+# Config-Schlüssel, die das Stylesheet beeinflussen
+STYLE_CONFIG_KEYS = ('background_color', 'border_color')
+
+
+class _DragState:
+    """Drag/Resize-Zustand eines Widgets (__slots__ statt Instanz-Dict)"""
+
+    __slots__ = ('dragging', 'drag_start', 'drag_origin', 'max_x', 'max_y',
+                 'resizing', 'resize_start', 'resize_start_size', 'min_w', 'min_h',
+                 'pending_pos')
+
+    def __init__(self):
+        self.dragging = False
+        self.drag_start = None  # Mausposition im Widget beim Drag-Start
+        self.drag_origin = None  # Widget-Position beim Drag-Start
+        self.max_x = None  # Beim Drag-Start gecachte Grenzen
+        self.max_y = None
+        self.resizing = False
+        self.resize_start = None  # Globale Mausposition beim Resize-Start
+        self.resize_start_size = None
+        self.min_w = 0  # Beim Resize-Start gecachte Mindestgröße
+        self.min_h = 0
+        self.pending_pos = None  # Letzte, noch nicht angewendete Mausposition
+
 
 class DashboardWidgetBase(QFrame):
     """Basis-Klasse für alle Dashboard-Widgets"""
@@ -20,6 +87,9 @@ class DashboardWidgetBase(QFrame):
     widget_deleted = pyqtSignal(str)  # widget_id
     widget_config_changed = pyqtSignal(str, dict)  # widget_id, config
 
+    # HTML-Export-Vorlage, befüllt mit snapshot_state()
+    HTML_TEMPLATE = BASE_WIDGET_HTML
+
     def __init__(self, widget_id: str = None, title: str = "Widget", parent=None):
         super().__init__(parent)
 
@@ -28,15 +98,18 @@ class DashboardWidgetBase(QFrame):
         self.widget_title = title
         self.widget_type = "base"
 
-        # Drag & Drop State
-        self.is_dragging = False
-        self.drag_start_pos = None
-        self.is_resizing = False
-        self.resize_start_pos = None
-        self.resize_start_size = None
+        # Drag & Drop State (kompakt in einem Slots-Objekt)
+        self._s = _DragState()
+
+        # Drag/Resize-Throttle: nur die letzte Mausposition wird angewendet
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(MOVE_THROTTLE_MS)
+        self._move_timer.timeout.connect(self._apply_pending_move)
 
         # Edit Mode
         self.edit_mode = True
+        self.setProperty("editMode", True)
 
         # Widget-Konfiguration
         self.config = {
@@ -47,6 +120,15 @@ class DashboardWidgetBase(QFrame):
             'update_interval': 1000,  # ms
         }
 
+        # Stylesheet-Cache
+        self._last_style = None
+        self._build_styles()
+
+        # Zeichenbereich und Trefferzone des Resize-Handles (in resizeEvent aktualisiert)
+        self._handle_rect = QRect()
+        self._handle_x0 = self._handle_y0 = 0
+        self._handle_x1 = self._handle_y1 = 0
+
         # UI Setup
         self.setMinimumSize(100, 80)
         self.setMaximumSize(800, 600)
@@ -55,7 +137,8 @@ class DashboardWidgetBase(QFrame):
         # Enable mouse tracking
         self.setMouseTracking(True)
 
-        # Context Menu
+        # Context Menu (wird beim ersten Rechtsklick erstellt)
+        self._context_menu = None
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
@@ -64,6 +147,12 @@ class DashboardWidgetBase(QFrame):
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         self.setLineWidth(2)
 
+        # Cursor einmalig erzeugen, setCursor nur bei Wechsel
+        self._cursor_move = QCursor(Qt.CursorShape.SizeAllCursor)
+        self._cursor_resize = QCursor(Qt.CursorShape.SizeFDiagCursor)
+        self._cursor_arrow = QCursor(Qt.CursorShape.ArrowCursor)
+        self._current_cursor = None
+
         # Haupt-Layout
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(5, 5, 5, 5)
@@ -86,24 +175,49 @@ class DashboardWidgetBase(QFrame):
 
         self.update_style()
 
+    @property
+    def is_dragging(self) -> bool:
+        """Wird das Widget gerade verschoben?"""
+        return self._s.dragging
+
+    @property
+    def is_resizing(self) -> bool:
+        """Wird das Widget gerade in der Größe verändert?"""
+        return self._s.resizing
+
+    def _build_styles(self):
+        """Berechnet das Stylesheet (Edit- und Ansichts-Modus) vor"""
+        self._style_sheet = WIDGET_STYLE_TEMPLATE.format(
+            background_color=self.config['background_color'],
+            border_color=self.config['border_color']
+        )
+
     def update_style(self):
-        """Aktualisiert das Widget-Styling"""
-        border_color = '#27ae60' if self.edit_mode else self.config['border_color']
-        border_width = 3 if self.edit_mode else 2
+        """Aktualisiert das Widget-Styling (nur wenn sich das Stylesheet ändert)"""
+        style = self._style_sheet
+        if style == self._last_style:
+            return
 
-        self.setStyleSheet(f"""
-            DashboardWidgetBase {{
-                background-color: {self.config['background_color']};
-                border: {border_width}px solid {border_color};
-                border-radius: 6px;
-            }}
-        """)
+        self._last_style = style
+        self.setStyleSheet(style)
 
     def set_edit_mode(self, enabled: bool):
         """Aktiviert/Deaktiviert Edit-Modus"""
-        self.edit_mode = enabled
-        self.update_style()
-        self.setCursor(QCursor(Qt.CursorShape.SizeAllCursor if enabled else Qt.CursorShape.ArrowCursor))
+        if enabled != self.edit_mode:
+            self.edit_mode = enabled
+            # Nur neu polieren, Stylesheet bleibt unverändert
+            self.setProperty("editMode", enabled)
+            self.style().unpolish(self)
+            self.style().polish(self)
+            # Das Neu-Polieren zeichnet den Rahmen bereits neu
+            self.update(self._handle_rect)
+        self._set_cursor(self._cursor_move if enabled else self._cursor_arrow)
+
+    def _set_cursor(self, cursor: QCursor):
+        """Setzt Cursor nur, wenn er sich ändert"""
+        if cursor is not self._current_cursor:
+            self._current_cursor = cursor
+            self.setCursor(cursor)
 
     def mousePressEvent(self, event):
         """Mouse Press Event für Drag & Drop"""
@@ -114,14 +228,24 @@ class DashboardWidgetBase(QFrame):
         if event.button() == Qt.MouseButton.LeftButton:
             # Prüfe ob Resize-Handle geklickt wurde (untere rechte Ecke)
             if self.is_in_resize_handle(event.pos()):
-                self.is_resizing = True
-                self.resize_start_pos = event.globalPosition().toPoint()
-                self.resize_start_size = self.size()
+                self._s.resizing = True
+                self._s.resize_start = event.globalPosition().toPoint()
+                self._s.resize_start_size = self.size()
+                self._s.min_w = self.minimumWidth()
+                self._s.min_h = self.minimumHeight()
                 event.accept()
             else:
                 # Starte Dragging
-                self.is_dragging = True
-                self.drag_start_pos = event.pos()
+                self._s.dragging = True
+                self._s.drag_start = event.pos()
+                self._s.drag_origin = self.pos()
+                # Grenzen einmalig pro Drag bestimmen (ändern sich währenddessen nicht)
+                parent = self.parent()
+                if parent:
+                    self._s.max_x = parent.width() - self.width()
+                    self._s.max_y = parent.height() - self.height()
+                else:
+                    self._s.max_x = self._s.max_y = None
                 self.raise_()
                 event.accept()
         else:
@@ -133,83 +257,120 @@ class DashboardWidgetBase(QFrame):
             super().mouseMoveEvent(event)
             return
 
-        if self.is_resizing:
-            # Resize Widget
-            delta = event.globalPosition().toPoint() - self.resize_start_pos
-            new_width = max(self.minimumWidth(), self.resize_start_size.width() + delta.x())
-            new_height = max(self.minimumHeight(), self.resize_start_size.height() + delta.y())
-
-            self.resize(new_width, new_height)
-            event.accept()
-
-        elif self.is_dragging and self.drag_start_pos:
-            # Move Widget
-            new_pos = self.mapToParent(event.pos() - self.drag_start_pos)
-
-            # Begrenze auf Parent-Widget
-            if self.parent():
-                parent_rect = self.parent().rect()
-                new_pos.setX(max(0, min(new_pos.x(), parent_rect.width() - self.width())))
-                new_pos.setY(max(0, min(new_pos.y(), parent_rect.height() - self.height())))
-
-            self.move(new_pos)
+        if self._s.resizing or (self._s.dragging and self._s.drag_start):
+            # Position merken, Anwendung gedrosselt über Timer
+            self._s.pending_pos = event.globalPosition().toPoint()
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
 
         else:
             # Update Cursor für Resize-Handle
             if self.is_in_resize_handle(event.pos()):
-                self.setCursor(QCursor(Qt.CursorShape.SizeFDiagCursor))
+                self._set_cursor(self._cursor_resize)
             else:
-                self.setCursor(QCursor(Qt.CursorShape.SizeAllCursor if self.edit_mode else Qt.CursorShape.ArrowCursor))
+                self._set_cursor(self._cursor_move)
 
             super().mouseMoveEvent(event)
 
+    @pyqtSlot()
+    def _apply_pending_move(self):
+        """Wendet die zuletzt gemerkte Mausposition an (Drag oder Resize)"""
+        state = self._s
+        global_pos = state.pending_pos
+        if global_pos is None:
+            return
+        state.pending_pos = None
+
+        if state.resizing:
+            # Resize Widget
+            delta = global_pos - state.resize_start
+            new_width = max(state.min_w, state.resize_start_size.width() + delta.x())
+            new_height = max(state.min_h, state.resize_start_size.height() + delta.y())
+
+            if new_width != self.width() or new_height != self.height():
+                self.resize(new_width, new_height)
+
+        elif state.dragging and state.drag_start:
+            # Move Widget
+            new_pos = self.mapToParent(self.mapFromGlobal(global_pos) - state.drag_start)
+
+            # Begrenze auf Parent-Widget
+            if state.max_x is not None:
+                new_pos.setX(max(0, min(new_pos.x(), state.max_x)))
+                new_pos.setY(max(0, min(new_pos.y(), state.max_y)))
+
+            if new_pos != self.pos():
+                self.move(new_pos)
+
     def mouseReleaseEvent(self, event):
         """Mouse Release Event"""
         if event.button() == Qt.MouseButton.LeftButton:
-            if self.is_dragging:
-                self.is_dragging = False
-                self.widget_moved.emit(self.widget_id, self.pos())
+            # Ausstehende Bewegung sofort anwenden, bevor Signale gesendet werden
+            self._move_timer.stop()
+            self._apply_pending_move()
+
+            if self._s.dragging:
+                self._s.dragging = False
+                self._s.max_x = self._s.max_y = None
+                # Reiner Klick ohne Bewegung: kein Signal
+                if self.pos() != self._s.drag_origin:
+                    self.widget_moved.emit(self.widget_id, self.pos())
                 event.accept()
-            elif self.is_resizing:
-                self.is_resizing = False
-                self.widget_resized.emit(self.widget_id, (self.width(), self.height()))
+            elif self._s.resizing:
+                self._s.resizing = False
+                if self.size() != self._s.resize_start_size:
+                    self.widget_resized.emit(self.widget_id, (self.width(), self.height()))
                 event.accept()
 
         super().mouseReleaseEvent(event)
 
     def is_in_resize_handle(self, pos: QPoint) -> bool:
-        """Prüft ob Position im Resize-Handle ist"""
-        handle_size = 15
-        return (self.width() - handle_size < pos.x() < self.width() and
-                self.height() - handle_size < pos.y() < self.height())
+        """Prüft ob Position im Resize-Handle ist (Grenzen aus resizeEvent)"""
+        x = pos.x()
+        y = pos.y()
+        return self._handle_x0 < x < self._handle_x1 and self._handle_y0 < y < self._handle_y1
+
+    def resizeEvent(self, event):
+        """Resize Event - aktualisiert Handle-Bereich und Trefferzone"""
+        super().resizeEvent(event)
+        width = self.width()
+        height = self.height()
+        self._handle_rect = QRect(
+            width - HANDLE_SIZE - HANDLE_MARGIN,
+            height - HANDLE_SIZE - HANDLE_MARGIN,
+            HANDLE_SIZE,
+            HANDLE_SIZE
+        )
+        self._handle_x0 = width - HANDLE_HIT_SIZE
+        self._handle_y0 = height - HANDLE_HIT_SIZE
+        self._handle_x1 = width
+        self._handle_y1 = height
 
     def paintEvent(self, event):
         """Paint Event - Zeichnet Resize-Handle"""
         super().paintEvent(event)
 
-        if self.edit_mode:
+        # Handle nur zeichnen, wenn er im neu zu zeichnenden Bereich liegt
+        if self.edit_mode and event.rect().intersects(self._handle_rect):
             painter = QPainter(self)
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(HANDLE_BRUSH)
+            painter.setPen(HANDLE_PEN)
+            painter.drawRect(self._handle_rect)
 
-            # Resize-Handle zeichnen
-            handle_size = 12
-            handle_rect = QRect(
-                self.width() - handle_size - 3,
-                self.height() - handle_size - 3,
-                handle_size,
-                handle_size
-            )
-
-            painter.setBrush(QColor(39, 174, 96))
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
-            painter.drawRect(handle_rect)
-
+    @pyqtSlot(QPoint)
     def show_context_menu(self, pos: QPoint):
         """Zeigt Kontext-Menü"""
         if not self.edit_mode:
             return
 
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        self._context_menu.exec(self.mapToGlobal(pos))
+
+    def _build_context_menu(self) -> QMenu:
+        """Erstellt das Kontext-Menü (einmalig beim ersten Rechtsklick)"""
         menu = QMenu(self)
 
         # Konfigurieren
@@ -226,31 +387,40 @@ class DashboardWidgetBase(QFrame):
         delete_action = menu.addAction("🗑️ Löschen")
         delete_action.triggered.connect(self.delete_widget)
 
-        menu.exec(self.mapToGlobal(pos))
+        return menu
 
+    @pyqtSlot()
     def open_config_dialog(self):
         """Öffnet Konfigurations-Dialog (Override in Subclasses)"""
         pass
 
+    @pyqtSlot()
     def duplicate_widget(self):
         """Dupliziert das Widget"""
         # Wird vom Dashboard-Builder gehandhabt
         pass
 
+    @pyqtSlot()
     def delete_widget(self):
         """Löscht das Widget"""
         self.widget_deleted.emit(self.widget_id)
         self.deleteLater()
 
-    def get_config(self) -> Dict[str, Any]:
-        """Gibt Widget-Konfiguration zurück"""
+    def get_config(self, copy: bool = True) -> Dict[str, Any]:
+        """
+        Gibt Widget-Konfiguration zurück
+
+        Args:
+            copy: False liefert 'config' als schreibgeschützte Ansicht statt als Kopie
+                  (für reine Leser wie das Speichern)
+        """
         return {
             'widget_id': self.widget_id,
             'widget_type': self.widget_type,
             'title': self.widget_title,
             'position': (self.x(), self.y()),
             'size': (self.width(), self.height()),
-            'config': self.config.copy()
+            'config': self.config.copy() if copy else MappingProxyType(self.config)
         }
 
     def set_config(self, config: Dict[str, Any]):
@@ -267,30 +437,62 @@ class DashboardWidgetBase(QFrame):
 
         if 'config' in config:
             self.config.update(config['config'])
-            self.update_style()
+            if any(key in config['config'] for key in STYLE_CONFIG_KEYS):
+                self._build_styles()
+                self.update_style()
 
-        self.widget_config_changed.emit(self.widget_id, config)
+        # Bisher ohne Abnehmer: Emit nur, wenn jemand verbunden ist
+        if self.receivers(self.widget_config_changed):
+            self.widget_config_changed.emit(self.widget_id, config)
 
     def update_data(self, data: Any):
         """Aktualisiert Widget-Daten (Override in Subclasses)"""
         pass
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Werte für HTML_TEMPLATE als einfache Python-Objekte (Override in Subclasses)"""
+        return {
+            'width': self.width(),
+            'height': self.height(),
+            'background_color': self.config['background_color'],
+            'border_color': self.config['border_color'],
+            'title_color': self.config['title_color'],
+            'title': self.widget_title,
+        }
+
+    def write_html(self, buf):
+        """Schreibt das Widget-HTML in einen gemeinsamen Puffer (z.B. io.StringIO)"""
+        buf.write(self.HTML_TEMPLATE.format_map(self.snapshot_state()))
+
     def to_html(self) -> str:
-        """Exportiert Widget als HTML (Override in Subclasses)"""
-        return f"""
-        <div class="dashboard-widget" style="
-            width: {self.width()}px;
-            height: {self.height()}px;
-            background-color: {self.config['background_color']};
-            border: 2px solid {self.config['border_color']};
-            border-radius: 6px;
-            padding: 5px;
-        ">
-            <h3 style="color: {self.config['title_color']}; text-align: center;">
-                {self.widget_title}
-            </h3>
-        </div>
+        """Exportiert Widget als HTML"""
+        buf = StringIO()
+        self.write_html(buf)
+        return buf.getvalue()
+
+    def html_snapshot(self) -> Tuple[str, Dict[str, Any]]:
         """
+        Vorlage und Werte für den HTML-Export
+
+        Das Ergebnis enthält keine Qt-Objekte und kann außerhalb des GUI-Threads
+        formatiert werden (render_widget_html). Unterklassen mit eigenem to_html()
+        oder write_html() werden hier direkt gerendert.
+        """
+        cls = type(self)
+        if (cls.to_html is not DashboardWidgetBase.to_html
+                or cls.write_html is not DashboardWidgetBase.write_html):
+            return PRE_RENDERED_HTML, {'html': self.to_html()}
+        return self.HTML_TEMPLATE, self.snapshot_state()
+
+
+def render_widget_html(template: str, state: Dict[str, Any]) -> str:
+    """Formatiert einen Widget-Snapshot aus html_snapshot() (thread-sicher)"""
+    return template.format_map(state)
+
+
+def write_widget_html(buf, template: str, state: Dict[str, Any]):
+    """Wie render_widget_html, schreibt aber direkt in einen Puffer (thread-sicher)"""
+    buf.write(template.format_map(state))
 
 
 class DashboardWidgetFactory:
@@ -306,10 +508,10 @@ class DashboardWidgetFactory:
     @classmethod
     def create_widget(cls, widget_type: str, config: Dict[str, Any] = None, parent=None) -> Optional[DashboardWidgetBase]:
         """Erstellt ein Widget"""
-        if widget_type not in cls._widget_types:
+        widget_class = cls._widget_types.get(widget_type)
+        if widget_class is None:
             return None
 
-        widget_class = cls._widget_types[widget_type]
         widget = widget_class(parent=parent)
 
         if config:
@@ -318,6 +520,14 @@ class DashboardWidgetFactory:
         return widget
 
     @classmethod
-    def get_available_widgets(cls) -> Dict[str, type]:
-        """Gibt alle verfügbaren Widget-Typen zurück"""
-        return cls._widget_types.copy()
+    def get_available_widgets(cls) -> Mapping[str, type]:
+        """Gibt alle verfügbaren Widget-Typen zurück (schreibgeschützte Ansicht)"""
+        return MappingProxyType(cls._widget_types)
+
+
+def register(widget_type: str):
+    """Klassen-Decorator: registriert die Widget-Klasse unter widget_type bei der Factory"""
+    def decorator(widget_class):
+        DashboardWidgetFactory.register_widget_type(widget_type, widget_class)
+        return widget_class
+    return decorator
@@ -8,16 +8,157 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QToolBar, QLabel
                              QPushButton, QScrollArea, QFrame, QListWidget, QListWidgetItem,
                              QSplitter, QFileDialog, QInputDialog, QMessageBox, QComboBox,
                              QGroupBox)
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer
+from PyQt6.QtCore import (Qt, QSize, pyqtSignal, pyqtSlot, QTimer, QPoint, QMimeData,
+                          QObject, QRunnable, QThreadPool)
 from PyQt6.QtGui import QIcon, QDrag, QPixmap, QPainter, QColor
 import json
 import os
+from contextlib import contextmanager
+from io import StringIO
+from functools import partial
 from datetime import datetime
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple
 
-from .base_widget import DashboardWidgetBase, DashboardWidgetFactory
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .base_widget import DashboardWidgetBase, DashboardWidgetFactory, write_widget_html
 from .widget_library import *  # Importiert alle Widget-Typen
 
+# Entprell-Fenster für DashboardCanvas.layout_changed
+LAYOUT_CHANGED_DEBOUNCE_MS = 50
+
+# HTML-Export-Vorlagen (str.format-Platzhalter, CSS-Klammern verdoppelt)
+WIDGET_HTML_TEMPLATE = """
+            <div style="
+                position: absolute;
+                left: {x}px;
+                top: {y}px;
+                width: {width}px;
+                height: {height}px;
+            ">
+                {content}
+            </div>
+            """
+
+DASHBOARD_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Arduino Dashboard</title>
+    <style>
+        body {{
+            margin: 0;
+            padding: 20px;
+            background-color: #1e1e1e;
+            color: #e0e0e0;
+            font-family: Arial, sans-serif;
+        }}
+        #dashboard {{
+            position: relative;
+            width: {width}px;
+            height: {height}px;
+            background-color: #1e1e1e;
+            border: 2px solid #555;
+            border-radius: 5px;
+            margin: 0 auto;
+        }}
+        .dashboard-widget {{
+            padding: 10px;
+        }}
+    </style>
+</head>
+<body>
+    <h1 style="text-align: center;">Arduino Control Panel - Dashboard</h1>
+    <div id="dashboard">
+        {widgets_html}
+    </div>
+    <script>
+        // Hier könnte WebSocket-Code für Live-Updates stehen
+        console.log('Dashboard geladen');
+    </script>
+</body>
+</html>
+        """
+
+
+# Vorlagen an den Inhalts-Platzhaltern geteilt, damit render_dashboard_html in einen Puffer schreiben kann
+_WIDGET_HTML_HEAD, _, _WIDGET_HTML_TAIL = WIDGET_HTML_TEMPLATE.partition("{content}")
+_WIDGET_HTML_TAIL = _WIDGET_HTML_TAIL.format()
+_DASHBOARD_HTML_HEAD, _, _DASHBOARD_HTML_TAIL = DASHBOARD_HTML_TEMPLATE.partition("{widgets_html}")
+_DASHBOARD_HTML_TAIL = _DASHBOARD_HTML_TAIL.format()
+
+
+def _json_default(obj):
+    """Serialisiert schreibgeschützte Config-Ansichten (MappingProxyType)"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_dashboard_json(config: Dict[str, Any]) -> bytes:
+    """Serialisiert eine Dashboard-Konfiguration als UTF-8 JSON (orjson, falls verfügbar)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(config, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _load_dashboard_json(data: bytes) -> Dict[str, Any]:
+    """Parst eine Dashboard-Datei (orjson, falls verfügbar)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _FileWriteSignals(QObject):
+    """Signale eines Hintergrund-Schreibauftrags"""
+
+    finished = pyqtSignal(str, str)  # filepath, Fehlermeldung ('' = Erfolg)
+
+
+class _FileWriteJob(QRunnable):
+    """Schreibt Daten außerhalb des GUI-Threads (data: bytes oder Callable, das bytes liefert)"""
+
+    def __init__(self, filepath: str, data):
+        super().__init__()
+        self.filepath = filepath
+        self.data = data
+        self.signals = _FileWriteSignals()
+
+    def run(self):
+        try:
+            data = self.data() if callable(self.data) else self.data
+            with open(self.filepath, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            self.signals.finished.emit(self.filepath, str(e))
+        else:
+            self.signals.finished.emit(self.filepath, "")
+
+
+def render_dashboard_html(canvas_width: int, canvas_height: int, entries: List[Tuple]) -> str:
+    """
+    Erzeugt die HTML-Seite aus einem Snapshot (siehe DashboardBuilderWidget._html_snapshot)
+
+    Arbeitet nur auf einfachen Python-Werten und kann daher im Hintergrund laufen.
+    Alle Teile werden nacheinander in einen gemeinsamen Puffer geschrieben.
+    """
+    buf = StringIO()
+    write = buf.write
+    write(_DASHBOARD_HTML_HEAD.format(width=canvas_width, height=canvas_height))
+    for x, y, w, h, template, state in entries:
+        write(_WIDGET_HTML_HEAD.format(x=x, y=y, width=w, height=h))
+        write_widget_html(buf, template, state)
+        write(_WIDGET_HTML_TAIL)
+    write(_DASHBOARD_HTML_TAIL)
+    return buf.getvalue()
+
 
 class DashboardCanvas(QFrame):
     """Canvas zum Platzieren von Widgets"""
@@ -31,6 +172,17 @@ class DashboardCanvas(QFrame):
         self.widgets = {}  # widget_id -> widget
         self.edit_mode = True
 
+        # Batch-Updates: layout_changed wird erst am Ende gesendet
+        self._batch_depth = 0
+        self._batch_changed = False
+
+        # Entprellung: Änderungen innerhalb eines Fensters ergeben ein layout_changed
+        self._layout_pending = False
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(LAYOUT_CHANGED_DEBOUNCE_MS)
+        self._layout_timer.timeout.connect(self.flush_layout_changed)
+
         # Canvas Setup
         self.setMinimumSize(800, 600)
         self.setStyleSheet("""
@@ -67,8 +219,9 @@ class DashboardCanvas(QFrame):
         widget.show()
 
         self.widget_added.emit(widget.widget_id)
-        self.layout_changed.emit()
+        self._notify_layout_changed()
 
+    @pyqtSlot(str)
     def remove_widget(self, widget_id: str):
         """Entfernt ein Widget"""
         if widget_id in self.widgets:
@@ -77,42 +230,104 @@ class DashboardCanvas(QFrame):
             del self.widgets[widget_id]
 
             self.widget_removed.emit(widget_id)
-            self.layout_changed.emit()
+            self._notify_layout_changed()
 
+    @pyqtSlot(str, QPoint)
     def on_widget_moved(self, widget_id: str, position):
         """Widget wurde verschoben"""
-        self.layout_changed.emit()
+        self._notify_layout_changed()
 
+    @pyqtSlot(str, tuple)
     def on_widget_resized(self, widget_id: str, size):
         """Widget wurde resized"""
+        self._notify_layout_changed()
+
+    def _notify_layout_changed(self):
+        """Meldet eine Layout-Änderung (innerhalb von batch_update gesammelt)"""
+        if self._batch_depth:
+            self._batch_changed = True
+        else:
+            self._schedule_layout_changed()
+
+    def _schedule_layout_changed(self):
+        """Startet das Entprell-Fenster, falls noch keine Meldung aussteht"""
+        if not self._layout_pending:
+            self._layout_pending = True
+            self._layout_timer.start()
+
+    @pyqtSlot()
+    def flush_layout_changed(self):
+        """Sendet ein ausstehendes layout_changed sofort"""
+        if not self._layout_pending:
+            return
+        self._layout_pending = False
+        self._layout_timer.stop()
         self.layout_changed.emit()
 
+    @contextmanager
+    def batch_update(self):
+        """Fasst mehrere Änderungen zu einem einzigen layout_changed zusammen"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_changed:
+                # Batch-Ende meldet sofort (inkl. evtl. ausstehender Einzeländerungen)
+                self._batch_changed = False
+                self._layout_pending = True
+                self.flush_layout_changed()
+
     def set_edit_mode(self, enabled: bool):
         """Setzt Edit-Modus für alle Widgets"""
         self.edit_mode = enabled
-        for widget in self.widgets.values():
-            widget.set_edit_mode(enabled)
+
+        # Ein Repaint für alle Widgets statt einem pro Widget
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in self.widgets.values():
+                widget.set_edit_mode(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def clear(self):
         """Löscht alle Widgets"""
-        widget_ids = list(self.widgets.keys())
-        for widget_id in widget_ids:
-            self.remove_widget(widget_id)
-
-    def get_layout_config(self) -> List[Dict]:
-        """Gibt Layout-Konfiguration zurück"""
-        return [widget.get_config() for widget in self.widgets.values()]
+        with self.batch_update():
+            widget_ids = list(self.widgets.keys())
+            for widget_id in widget_ids:
+                self.remove_widget(widget_id)
+
+    def snapshot_geometry(self) -> Tuple[List[str], List[int], List[int], List[int], List[int]]:
+        """Geometrie aller Widgets in einem Durchlauf als parallele Listen (ids, xs, ys, ws, hs)"""
+        ids, xs, ys, ws, hs = [], [], [], [], []
+        for widget_id, widget in self.widgets.items():
+            geometry = widget.geometry()
+            ids.append(widget_id)
+            xs.append(geometry.x())
+            ys.append(geometry.y())
+            ws.append(geometry.width())
+            hs.append(geometry.height())
+        return ids, xs, ys, ws, hs
+
+    def get_layout_config(self, copy: bool = True) -> List[Dict]:
+        """Gibt Layout-Konfiguration zurück (copy=False: Widget-Configs als Ansicht)"""
+        return [widget.get_config(copy) for widget in self.widgets.values()]
 
     def load_layout_config(self, config: List[Dict]):
         """Lädt Layout-Konfiguration"""
-        self.clear()
+        self.setUpdatesEnabled(False)
+        try:
+            with self.batch_update():
+                self.clear()
 
-        for widget_config in config:
-            widget_type = widget_config.get('widget_type')
-            widget = DashboardWidgetFactory.create_widget(widget_type, config=widget_config, parent=self)
+                for widget_config in config:
+                    widget_type = widget_config.get('widget_type')
+                    widget = DashboardWidgetFactory.create_widget(widget_type, config=widget_config, parent=self)
 
-            if widget:
-                self.add_widget(widget, widget_config.get('position'))
+                    if widget:
+                        self.add_widget(widget, widget_config.get('position'))
+        finally:
+            self.setUpdatesEnabled(True)
 
     def dragEnterEvent(self, event):
         """Drag Enter Event"""
@@ -141,6 +356,10 @@ class DashboardCanvas(QFrame):
 class WidgetPalette(QListWidget):
     """Palette mit verfügbaren Widgets"""
 
+    # Item-Rolle für die vorgerenderte Drag-Vorschau
+    DRAG_PIXMAP_ROLE = Qt.ItemDataRole.UserRole + 1
+    DRAG_PIXMAP_SIZE = 32
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -180,8 +399,24 @@ class WidgetPalette(QListWidget):
             item = QListWidgetItem(f"{name}\n{description}")
             item.setData(Qt.ItemDataRole.UserRole, widget_type)
             item.setToolTip(description)
+            item.setData(self.DRAG_PIXMAP_ROLE, self._render_drag_pixmap(name.split()[0]))
             self.addItem(item)
 
+    def _render_drag_pixmap(self, symbol: str) -> QPixmap:
+        """Rendert die Drag-Vorschau eines Widget-Typs (einmalig beim Befüllen)"""
+        size = self.DRAG_PIXMAP_SIZE
+        pixmap = QPixmap(size, size)
+        pixmap.fill(QColor(52, 152, 219, 200))
+
+        painter = QPainter(pixmap)
+        font = painter.font()
+        font.setPixelSize(size - 10)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, symbol)
+        painter.end()
+
+        return pixmap
+
     def startDrag(self, supportedActions):
         """Startet Drag-Operation"""
         item = self.currentItem()
@@ -192,10 +427,16 @@ class WidgetPalette(QListWidget):
 
         # Erstelle Drag-Object
         drag = QDrag(self)
-        mime_data = drag.mimeData()
+        mime_data = QMimeData()
         mime_data.setText(widget_type)
         drag.setMimeData(mime_data)
 
+        # Vorgerenderte Vorschau statt Rendering des Items bei jedem Drag
+        pixmap = item.data(self.DRAG_PIXMAP_ROLE)
+        if pixmap is not None:
+            drag.setPixmap(pixmap)
+            drag.setHotSpot(QPoint(pixmap.width() // 2, pixmap.height() // 2))
+
         # Drag ausführen
         drag.exec(Qt.DropAction.CopyAction)
 
@@ -210,6 +451,13 @@ class DashboardBuilderWidget(QWidget):
 
         self.current_file = None
         self.is_modified = False
+        self._widget_count = 0  # Zuletzt angezeigte Widget-Anzahl
+        self._last_saved_hash = None  # Inhalts-Hash des letzten Schreibvorgangs
+
+        # Datei-I/O im Hintergrund; ein Thread hält die Schreibreihenfolge ein
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        self._pending_writes = set()
 
         self.setup_ui()
 
@@ -355,6 +603,7 @@ class DashboardBuilderWidget(QWidget):
 
         return toolbar_widget
 
+    @pyqtSlot()
     def toggle_edit_mode(self):
         """Schaltet Edit-Modus um"""
         is_edit = self.edit_mode_toggle.isChecked()
@@ -367,6 +616,7 @@ class DashboardBuilderWidget(QWidget):
             self.edit_mode_toggle.setText("👁️ Ansicht")
             self.status_label.setText("Ansichts-Modus - Widgets sind fixiert")
 
+    @pyqtSlot()
     def new_dashboard(self):
         """Erstellt ein neues Dashboard"""
         if self.is_modified:
@@ -386,6 +636,7 @@ class DashboardBuilderWidget(QWidget):
         self.is_modified = False
         self.status_label.setText("Neues Dashboard erstellt")
 
+    @pyqtSlot()
     def open_dashboard(self):
         """Öffnet ein Dashboard"""
         filepath, _ = QFileDialog.getOpenFileName(
@@ -394,8 +645,8 @@ class DashboardBuilderWidget(QWidget):
 
         if filepath:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(filepath, 'rb') as f:
+                    config = _load_dashboard_json(f.read())
 
                 self.canvas.load_layout_config(config.get('widgets', []))
                 self.current_file = filepath
@@ -405,6 +656,7 @@ class DashboardBuilderWidget(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Fehler", f"Fehler beim Laden:\n{str(e)}")
 
+    @pyqtSlot()
     def save_dashboard(self):
         """Speichert das Dashboard"""
         if not self.current_file:
@@ -412,6 +664,7 @@ class DashboardBuilderWidget(QWidget):
 
         return self._save_to_file(self.current_file)
 
+    @pyqtSlot()
     def save_dashboard_as(self):
         """Speichert das Dashboard unter neuem Namen"""
         filepath, _ = QFileDialog.getSaveFileName(
@@ -427,28 +680,72 @@ class DashboardBuilderWidget(QWidget):
         return False
 
     def _save_to_file(self, filepath: str) -> bool:
-        """Speichert in Datei"""
+        """Speichert in Datei (das Schreiben selbst läuft im Hintergrund)"""
+        # Ausstehende Änderungen vor dem Zurücksetzen von is_modified zustellen
+        self.canvas.flush_layout_changed()
         try:
             config = {
                 'version': '1.0',
                 'created': datetime.now().isoformat(),
                 'canvas_size': (self.canvas.width(), self.canvas.height()),
-                'widgets': self.canvas.get_layout_config()
+                'widgets': self.canvas.get_layout_config(copy=False)
             }
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # Unveränderter Inhalt (ohne Zeitstempel) in dieselbe Datei: Schreiben sparen
+            content_hash = hash((filepath, repr(config['canvas_size']), repr(config['widgets'])))
+            if content_hash == self._last_saved_hash and os.path.exists(filepath):
+                self.current_file = filepath
+                self.is_modified = False
+                self.status_label.setText(f"Unverändert: {os.path.basename(filepath)}")
+                self.dashboard_saved.emit(filepath)
+                return True
 
+            # Serialisieren im GUI-Thread (liest Widgets), Schreiben im Hintergrund
+            data = _dump_dashboard_json(config)
             self.current_file = filepath
             self.is_modified = False
-            self.status_label.setText(f"Gespeichert: {os.path.basename(filepath)}")
-            self.dashboard_saved.emit(filepath)
+            self.status_label.setText(f"Speichere: {os.path.basename(filepath)}...")
+            self._write_in_background(filepath, data, partial(self._on_save_finished, content_hash))
             return True
 
         except Exception as e:
             QMessageBox.critical(self, "Fehler", f"Fehler beim Speichern:\n{str(e)}")
             return False
 
+    def _write_in_background(self, filepath: str, data, on_finished):
+        """Startet einen Schreibauftrag; on_finished(filepath, error) läuft im GUI-Thread"""
+        job = _FileWriteJob(filepath, data)
+        self._pending_writes.add(job)
+        job.signals.finished.connect(on_finished)
+        job.signals.finished.connect(partial(self._pending_writes.discard, job))
+        self._io_pool.start(job)
+
+    def wait_for_pending_writes(self, msecs: int = -1) -> bool:
+        """Wartet, bis alle Hintergrund-Schreibaufträge abgeschlossen sind"""
+        return self._io_pool.waitForDone(msecs)
+
+    def _on_save_finished(self, content_hash: int, filepath: str, error: str):
+        """Abschluss eines Speicher-Auftrags"""
+        if error:
+            self.is_modified = True
+            self.status_label.setText(f"Fehler beim Speichern: {os.path.basename(filepath)}")
+            QMessageBox.critical(self, "Fehler", f"Fehler beim Speichern:\n{error}")
+            return
+
+        self._last_saved_hash = content_hash
+        self.status_label.setText(f"Gespeichert: {os.path.basename(filepath)}")
+        self.dashboard_saved.emit(filepath)
+
+    def _on_export_finished(self, filepath: str, error: str):
+        """Abschluss eines HTML-Exports"""
+        if error:
+            QMessageBox.critical(self, "Fehler", f"Fehler beim HTML-Export:\n{error}")
+            return
+
+        self.status_label.setText(f"HTML exportiert: {os.path.basename(filepath)}")
+        QMessageBox.information(self, "Erfolg", f"Dashboard als HTML exportiert:\n{filepath}")
+
+    @pyqtSlot()
     def export_html(self):
         """Exportiert Dashboard als HTML"""
         filepath, _ = QFileDialog.getSaveFileName(
@@ -460,78 +757,33 @@ class DashboardBuilderWidget(QWidget):
                 filepath += '.html'
 
             try:
-                html = self._generate_html()
-
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(html)
-
-                self.status_label.setText(f"HTML exportiert: {os.path.basename(filepath)}")
-                QMessageBox.information(self, "Erfolg", f"Dashboard als HTML exportiert:\n{filepath}")
+                # Nur der Snapshot entsteht im GUI-Thread, Formatieren und Schreiben im Hintergrund
+                snapshot = self._html_snapshot()
+                self.status_label.setText(f"Exportiere: {os.path.basename(filepath)}...")
+                self._write_in_background(
+                    filepath,
+                    lambda: render_dashboard_html(*snapshot).encode('utf-8'),
+                    self._on_export_finished
+                )
 
             except Exception as e:
                 QMessageBox.critical(self, "Fehler", f"Fehler beim HTML-Export:\n{str(e)}")
 
+    def _html_snapshot(self) -> Tuple[int, int, List[Tuple]]:
+        """Liest Canvas und Widgets für den HTML-Export aus (GUI-Thread)"""
+        widgets = self.canvas.widgets
+        ids, xs, ys, ws, hs = self.canvas.snapshot_geometry()
+        entries = [
+            (x, y, w, h, *widgets[widget_id].html_snapshot())
+            for widget_id, x, y, w, h in zip(ids, xs, ys, ws, hs)
+        ]
+        return self.canvas.width(), self.canvas.height(), entries
+
     def _generate_html(self) -> str:
         """Generiert HTML aus aktuellem Dashboard"""
-        widgets_html = ""
-
-        for widget in self.canvas.widgets.values():
-            widget_html = widget.to_html()
-            widgets_html += f"""
-            <div style="
-                position: absolute;
-                left: {widget.x()}px;
-                top: {widget.y()}px;
-                width: {widget.width()}px;
-                height: {widget.height()}px;
-            ">
-                {widget_html}
-            </div>
-            """
-
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Arduino Dashboard</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 20px;
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-            font-family: Arial, sans-serif;
-        }}
-        #dashboard {{
-            position: relative;
-            width: {self.canvas.width()}px;
-            height: {self.canvas.height()}px;
-            background-color: #1e1e1e;
-            border: 2px solid #555;
-            border-radius: 5px;
-            margin: 0 auto;
-        }}
-        .dashboard-widget {{
-            padding: 10px;
-        }}
-    </style>
-</head>
-<body>
-    <h1 style="text-align: center;">Arduino Control Panel - Dashboard</h1>
-    <div id="dashboard">
-        {widgets_html}
-    </div>
-    <script>
-        // Hier könnte WebSocket-Code für Live-Updates stehen
-        console.log('Dashboard geladen');
-    </script>
-</body>
-</html>
-        """
-
-        return html
+        return render_dashboard_html(*self._html_snapshot())
 
+    @pyqtSlot()
     def clear_dashboard(self):
         """Löscht alle Widgets"""
         reply = QMessageBox.question(
@@ -545,11 +797,14 @@ class DashboardBuilderWidget(QWidget):
             self.is_modified = True
             self.status_label.setText("Dashboard geleert")
 
+    @pyqtSlot()
     def on_layout_changed(self):
         """Layout wurde geändert"""
         self.is_modified = True
         widget_count = len(self.canvas.widgets)
-        self.widget_count_label.setText(f"Widgets: {widget_count}")
+        if widget_count != self._widget_count:
+            self._widget_count = widget_count
+            self.widget_count_label.setText(f"Widgets: {widget_count}")
 
     def get_canvas(self) -> DashboardCanvas:
         """Gibt das Canvas zurück"""
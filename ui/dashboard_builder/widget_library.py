@@ -5,20 +5,126 @@ Vordefinierte Dashboard-Widgets
 """
 
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QHBoxLayout, QProgressBar, QPushButton
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QLinearGradient
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRect, QRectF
+from PyQt6.QtGui import (QPainter, QColor, QPen, QBrush, QFont, QFontMetrics, QLinearGradient,
+                         QPixmap, QPainterPath)
 import math
-from .base_widget import DashboardWidgetBase, DashboardWidgetFactory
+from .base_widget import DashboardWidgetBase, register
+
+
+# Zeichen-Ressourcen für Gauge/LED (einmalig beim Import erzeugt)
+FONT_VALUE = QFont("Arial", 24, QFont.Weight.Bold)
+FONT_SMALL = QFont("Arial", 10)
+COLOR_TRACK = QColor(60, 60, 60)
+COLOR_CRITICAL = QColor(231, 76, 60)  # Rot
+COLOR_WARNING = QColor(243, 156, 18)  # Orange
+COLOR_OK = QColor(39, 174, 96)  # Grün
+COLOR_TEXT = QColor(224, 224, 224)
+PEN_TRACK = QPen(COLOR_TRACK, 8, Qt.PenStyle.SolidLine)
+PEN_CRITICAL = QPen(COLOR_CRITICAL, 8, Qt.PenStyle.SolidLine)
+PEN_WARNING = QPen(COLOR_WARNING, 8, Qt.PenStyle.SolidLine)
+PEN_OK = QPen(COLOR_OK, 8, Qt.PenStyle.SolidLine)
+PEN_TEXT = QPen(COLOR_TEXT)
+
+# HTML-Export-Vorlagen (str.format)
+VALUE_DISPLAY_HTML = """
+        <div class="value-widget" style="text-align: center; padding: 10px;">
+            <h3>{title}</h3>
+            <div style="font-size: 36px; color: #3498db; font-weight: bold;">
+                {value:.1f}
+            </div>
+            <div style="font-size: 14px; color: #95a5a6;">
+                {unit}
+            </div>
+        </div>
+        """
 
+GAUGE_HTML = """
+        <div class="gauge-widget" style="text-align: center;">
+            <h3>{title}</h3>
+            <div style="font-size: 32px; color: #3498db;">
+                {value:.1f}
+            </div>
+            <div style="width: 200px; height: 20px; background: #333; border-radius: 10px; margin: 10px auto;">
+                <div style="width: {percent}%; height: 100%; background: #27ae60; border-radius: 10px;"></div>
+            </div>
+        </div>
+        """
+
+LED_HTML = """
+        <div class="led-widget" style="text-align: center;">
+            <h3>{title}</h3>
+            <div style="
+                width: 60px;
+                height: 60px;
+                border-radius: 50%;
+                background: {color};
+                margin: 10px auto;
+                box-shadow: 0 0 20px {color};
+            "></div>
+            <div>{status}</div>
+        </div>
+        """
 
+BUTTON_HTML = """
+        <div class="button-widget" style="text-align: center;">
+            <h3>{title}</h3>
+            <button style="
+                background: #3498db;
+                color: white;
+                border: none;
+                border-radius: 5px;
+                padding: 15px 30px;
+                font-size: 14px;
+                cursor: pointer;
+            ">{text}</button>
+        </div>
+        """
+
+PROGRESS_HTML = """
+        <div class="progress-widget">
+            <h3>{title}</h3>
+            <div style="
+                width: 100%;
+                height: 30px;
+                background: #2b2b2b;
+                border: 2px solid #555;
+                border-radius: 5px;
+                overflow: hidden;
+            ">
+                <div style="
+                    width: {percent}%;
+                    height: 100%;
+                    background: #27ae60;
+                    display: flex;
+                    align-items: center;
+                    justify-content: center;
+                    color: white;
+                ">{percent:.0f}%</div>
+            </div>
+        </div>
+        """
+
+LABEL_HTML = """
+        <div class="label-widget" style="text-align: center; padding: 10px;">
+            <h3>{title}</h3>
+            <div style="font-size: 14px;">{text}</div>
+        </div>
+        """
+
+
+@register("value_display")
 class ValueDisplayWidget(DashboardWidgetBase):
     """Einfaches Wert-Anzeige-Widget"""
 
+    HTML_TEMPLATE = VALUE_DISPLAY_HTML
+
     def __init__(self, parent=None):
         super().__init__(title="Wert", parent=parent)
         self.widget_type = "value_display"
         self.current_value = 0
         self.unit = ""
+        self._last_text = "--"  # Zuletzt angezeigter Wert-Text
 
         # Value Label
         self.value_label = QLabel("--")
@@ -42,26 +148,24 @@ class ValueDisplayWidget(DashboardWidgetBase):
         else:
             self.current_value = data
 
-        self.value_label.setText(f"{self.current_value:.1f}")
-        self.unit_label.setText(self.unit)
+        # Labels nur bei geändertem Text anfassen
+        value_text = "%.1f" % self.current_value
+        if value_text != self._last_text:
+            self._last_text = value_text
+            self.value_label.setText(value_text)
+        if self.unit != self.unit_label.text():
+            self.unit_label.setText(self.unit)
 
-    def to_html(self):
-        return f"""
-        <div class="value-widget" style="text-align: center; padding: 10px;">
-            <h3>{self.widget_title}</h3>
-            <div style="font-size: 36px; color: #3498db; font-weight: bold;">
-                {self.current_value:.1f}
-            </div>
-            <div style="font-size: 14px; color: #95a5a6;">
-                {self.unit}
-            </div>
-        </div>
-        """
+    def snapshot_state(self):
+        return {'title': self.widget_title, 'value': self.current_value, 'unit': self.unit}
 
 
+@register("gauge")
 class GaugeWidget(DashboardWidgetBase):
     """Gauge/Tachometer-Widget"""
 
+    HTML_TEMPLATE = GAUGE_HTML
+
     def __init__(self, parent=None):
         super().__init__(title="Gauge", parent=parent)
         self.widget_type = "gauge"
@@ -70,54 +174,95 @@ class GaugeWidget(DashboardWidgetBase):
         self.max_value = 100
         self.warning_threshold = 75
         self.critical_threshold = 90
+        self._inv_range = 1.0 / (self.max_value - self.min_value)
+        self._pen_value = PEN_OK  # Stift des Wert-Arcs, wird in update_data gewählt
+        self._value_text = "%.1f" % self.current_value
+        self._span16 = 0  # Winkel des Wert-Arcs in 1/16 Grad (wie drawArc)
+
+        # Statischer Hintergrund (Arc + Min/Max) wird gecacht, nur Wert-Arc/-Text pro Paint
+        self._bg_pixmap = None
+        self._center_x = 0
+        self._center_y = 0
+        self._radius = 0
+        self._dynamic_rect = QRect()  # Bereich von Wert-Arc und Wert-Text
+        self._arc_rect = QRectF()
+        self._value_path = QPainterPath()  # Wert-Arc, wird in update_data aufgebaut
 
         self.setMinimumSize(150, 150)
 
-    def paintEvent(self, event):
-        """Zeichnet das Gauge"""
-        super().paintEvent(event)
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def resizeEvent(self, event):
+        """Resize Event - verwirft den Hintergrund-Cache"""
+        super().resizeEvent(event)
+        self._bg_pixmap = None
 
+    def _render_background(self) -> QPixmap:
+        """Rendert Hintergrund-Arc und Min/Max-Labels in eine Pixmap"""
         # Berechne Dimensionen
         width = self.width()
         height = self.height() - 40  # Platz für Titel
-        center_x = width // 2
-        center_y = height - 20
-        radius = min(width, height) // 2 - 20
+        self._center_x = center_x = width // 2
+        self._center_y = center_y = height - 20
+        self._radius = radius = min(width, height) // 2 - 20
+
+        # Wert-Arc (inkl. halber Stiftbreite) und Textzeile des Werts
+        arc_rect = QRect(center_x - radius, center_y - radius, radius * 2, radius * 2)
+        metrics = QFontMetrics(FONT_VALUE)
+        text_rect = QRect(0, center_y - 10 - metrics.ascent(), width, metrics.height())
+        self._dynamic_rect = arc_rect.adjusted(-5, -5, 5, 5).united(text_rect)
+        self._arc_rect = QRectF(arc_rect)
+        self._build_value_path()
+
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Zeichne Hintergrund-Arc
-        painter.setPen(QPen(QColor(60, 60, 60), 8, Qt.PenStyle.SolidLine))
-        painter.drawArc(
-            center_x - radius, center_y - radius, radius * 2, radius * 2,
-            -45 * 16, -270 * 16
-        )
+        painter.setPen(PEN_TRACK)
+        painter.drawPath(self._arc_path(-270))
 
-        # Berechne Wert-Prozent
-        value_percent = (self.current_value - self.min_value) / (self.max_value - self.min_value)
-        value_percent = max(0, min(1, value_percent))
+        # Zeichne Min/Max Labels
+        painter.setPen(PEN_TEXT)
+        painter.setFont(FONT_SMALL)
+        painter.drawText(10, height - 5, f"{self.min_value}")
+        max_text = f"{self.max_value}"
+        max_width = painter.fontMetrics().horizontalAdvance(max_text)
+        painter.drawText(width - max_width - 10, height - 5, max_text)
+        painter.end()
 
-        # Farbe basierend auf Schwellwerten
-        if self.current_value >= self.critical_threshold:
-            color = QColor(231, 76, 60)  # Rot
-        elif self.current_value >= self.warning_threshold:
-            color = QColor(243, 156, 18)  # Orange
-        else:
-            color = QColor(39, 174, 96)  # Grün
+        return pixmap
+
+    def paintEvent(self, event):
+        """Zeichnet das Gauge"""
+        super().paintEvent(event)
+
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._render_background()
+
+        painter = QPainter(self)
+        painter.setClipRect(event.rect())
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+
+        # Teil-Repaints außerhalb von Wert-Arc/-Text brauchen nur den Hintergrund
+        if not event.rect().intersects(self._dynamic_rect):
+            return
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        center_x = self._center_x
+        center_y = self._center_y
 
         # Zeichne Wert-Arc
-        painter.setPen(QPen(color, 8, Qt.PenStyle.SolidLine))
-        span_angle = int(-270 * value_percent * 16)
-        painter.drawArc(
-            center_x - radius, center_y - radius, radius * 2, radius * 2,
-            -45 * 16, span_angle
-        )
+        painter.setPen(self._pen_value)
+        painter.drawPath(self._value_path)
 
         # Zeichne Wert-Text
-        painter.setPen(QPen(QColor(224, 224, 224)))
-        painter.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        value_text = f"{self.current_value:.1f}"
+        painter.setPen(PEN_TEXT)
+        painter.setFont(FONT_VALUE)
+        value_text = self._value_text
         text_rect = painter.fontMetrics().boundingRect(value_text)
         painter.drawText(
             center_x - text_rect.width() // 2,
@@ -125,128 +270,201 @@ class GaugeWidget(DashboardWidgetBase):
             value_text
         )
 
-        # Zeichne Min/Max Labels
-        painter.setFont(QFont("Arial", 10))
-        painter.drawText(10, height - 5, f"{self.min_value}")
-        max_text = f"{self.max_value}"
-        max_width = painter.fontMetrics().horizontalAdvance(max_text)
-        painter.drawText(width - max_width - 10, height - 5, max_text)
-
     def update_data(self, data):
         """Aktualisiert Gauge-Wert"""
         if isinstance(data, dict):
-            self.current_value = data.get('value', 0)
-            self.min_value = data.get('min', 0)
-            self.max_value = data.get('max', 100)
+            value = data.get('value', 0)
+            min_value = data.get('min', 0)
+            max_value = data.get('max', 100)
         else:
-            self.current_value = data
-
-        self.update()
-
-    def to_html(self):
-        value_percent = (self.current_value - self.min_value) / (self.max_value - self.min_value)
-        value_percent = max(0, min(1, value_percent)) * 100
-
-        return f"""
-        <div class="gauge-widget" style="text-align: center;">
-            <h3>{self.widget_title}</h3>
-            <div style="font-size: 32px; color: #3498db;">
-                {self.current_value:.1f}
-            </div>
-            <div style="width: 200px; height: 20px; background: #333; border-radius: 10px; margin: 10px auto;">
-                <div style="width: {value_percent}%; height: 100%; background: #27ae60; border-radius: 10px;"></div>
-            </div>
-        </div>
-        """
+            value, min_value, max_value = data, self.min_value, self.max_value
 
+        # Unveränderte Werte: kein Repaint
+        if (value, min_value, max_value) == (self.current_value, self.min_value, self.max_value):
+            return
 
+        self.current_value = value
+        # Farbe basierend auf Schwellwerten
+        pen = (PEN_CRITICAL if value >= self.critical_threshold
+               else PEN_WARNING if value >= self.warning_threshold
+               else PEN_OK)
+        repaint = pen is not self._pen_value
+        self._pen_value = pen
+        if (min_value, max_value) != (self.min_value, self.max_value):
+            self.min_value = min_value
+            self.max_value = max_value
+            span = max_value - min_value
+            self._inv_range = (1.0 / span) if span else 0.0
+            self._bg_pixmap = None  # Min/Max-Labels neu rendern
+            repaint = True
+
+        # Nur neu zeichnen, wenn sich Text, Arc oder Farbe sichtbar ändern
+        value_text = "%.1f" % value
+        if value_text != self._value_text:
+            self._value_text = value_text
+            repaint = True
+        span16 = int(-270 * self._value_fraction() * 16)
+        if span16 != self._span16:
+            self._span16 = span16
+            self._build_value_path()
+            repaint = True
+
+        if repaint:
+            self.update()
+
+    def _arc_path(self, span: float) -> QPainterPath:
+        """Arc ab -45° über span Grad im aktuellen Gauge-Rechteck"""
+        path = QPainterPath()
+        path.arcMoveTo(self._arc_rect, -45)
+        path.arcTo(self._arc_rect, -45, span)
+        return path
+
+    def _build_value_path(self):
+        """Baut den Wert-Arc neu auf (Winkel wie bei drawArc in 1/16 Grad gerastert)"""
+        self._value_path = self._arc_path(self._span16 / 16)
+
+    def _value_fraction(self) -> float:
+        """Anteil des Werts am Bereich min..max, auf 0..1 begrenzt (leerer Bereich: 0)"""
+        fraction = (self.current_value - self.min_value) * self._inv_range
+        return 0 if fraction <= 0 else 1 if fraction >= 1 else fraction
+
+    def snapshot_state(self):
+        return {'title': self.widget_title, 'value': self.current_value,
+                'percent': self._value_fraction() * 100}
+
+
+@register("led")
 class LEDWidget(DashboardWidgetBase):
     """LED-Indikator-Widget"""
 
+    HTML_TEMPLATE = LED_HTML
+
+    # Vorgerenderte LEDs: (Radius, an/aus, Farbe, Pixel-Ratio) -> QPixmap
+    _led_cache = {}
+    LED_GLOW_MARGIN = 10  # Glow-Ring (Radius + 5) plus halbe Stiftbreite
+
     def __init__(self, parent=None):
         super().__init__(title="LED", parent=parent)
         self.widget_type = "led"
         self.is_on = False
-        self.color_on = QColor(39, 174, 96)  # Grün
-        self.color_off = QColor(60, 60, 60)
+        self.color_on = QColor(COLOR_OK)
+        self.color_off = QColor(COLOR_TRACK)
+        self._dynamic_rect = QRect()  # Bereich von LED, Glow und Status-Text
+        self._center_x = 0
+        self._center_y = 0
+        self._radius = 0
 
         self.setMinimumSize(100, 100)
         self.setMaximumSize(200, 200)
 
+    def resizeEvent(self, event):
+        """Resize Event - bestimmt den Zeichenbereich der LED"""
+        super().resizeEvent(event)
+        width = self.width()
+        height = self.height() - 40
+        self._center_x = center_x = width // 2
+        self._center_y = center_y = height // 2 + 20
+        self._radius = radius = min(width, height) // 3
+
+        # Glow-Ring und Zeile des Status-Texts
+        glow = radius + self.LED_GLOW_MARGIN
+        metrics = QFontMetrics(FONT_SMALL)
+        self._dynamic_rect = QRect(center_x - glow, center_y - glow, glow * 2, glow * 2).united(
+            QRect(0, height + 35 - metrics.ascent(), width, metrics.height())
+        )
+
     def paintEvent(self, event):
         """Zeichnet die LED"""
         super().paintEvent(event)
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Teil-Repaints außerhalb von LED und Text überspringen
+        if not event.rect().intersects(self._dynamic_rect):
+            return
 
-        # Berechne LED-Position
-        width = self.width()
+        center_x = self._center_x
         height = self.height() - 40
-        center_x = width // 2
-        center_y = height // 2 + 20
-        radius = min(width, height) // 3
 
-        # LED-Farbe
+        # LED aus dem Cache
         color = self.color_on if self.is_on else self.color_off
+        pixmap = self._led_pixmap(self._radius, self.is_on, color, self.devicePixelRatioF())
+        offset = self._radius + self.LED_GLOW_MARGIN
+
+        painter = QPainter(self)
+        painter.setClipRect(event.rect())
+        painter.drawPixmap(center_x - offset, self._center_y - offset, pixmap)
+
+        # Status-Text
+        painter.setPen(PEN_TEXT)
+        painter.setFont(FONT_SMALL)
+        status_text = "ON" if self.is_on else "OFF"
+        text_rect = painter.fontMetrics().boundingRect(status_text)
+        painter.drawText(
+            center_x - text_rect.width() // 2,
+            height + 35,
+            status_text
+        )
+
+    @classmethod
+    def _led_pixmap(cls, radius: int, is_on: bool, color: QColor, dpr: float) -> QPixmap:
+        """Liefert die vorgerenderte LED (Ring, Füllung, ggf. Glow) für einen Zustand"""
+        key = (radius, is_on, color.rgba(), dpr)
+        pixmap = cls._led_cache.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        center = radius + cls.LED_GLOW_MARGIN
+        size = center * 2
+        pixmap = QPixmap(int(size * dpr), int(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Zeichne äußeren Ring
         painter.setPen(QPen(color.darker(150), 3))
         painter.setBrush(QBrush(color))
-        painter.drawEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
+        painter.drawEllipse(center - radius, center - radius, radius * 2, radius * 2)
 
         # Glow-Effekt wenn an
-        if self.is_on:
+        if is_on:
             painter.setPen(QPen(color.lighter(150), 8))
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawEllipse(
-                center_x - radius - 5, center_y - radius - 5,
+                center - radius - 5, center - radius - 5,
                 radius * 2 + 10, radius * 2 + 10
             )
+        painter.end()
 
-        # Status-Text
-        painter.setPen(QPen(QColor(224, 224, 224)))
-        painter.setFont(QFont("Arial", 10))
-        status_text = "ON" if self.is_on else "OFF"
-        text_rect = painter.fontMetrics().boundingRect(status_text)
-        painter.drawText(
-            center_x - text_rect.width() // 2,
-            height + 35,
-            status_text
-        )
+        cls._led_cache[key] = pixmap
+        return pixmap
 
     def update_data(self, data):
         """Aktualisiert LED-Status"""
         if isinstance(data, dict):
-            self.is_on = data.get('value', False)
+            is_on = bool(data.get('value', False))
         else:
-            self.is_on = bool(data)
+            is_on = bool(data)
 
-        self.update()
+        # Unveränderter Zustand: kein Repaint
+        if is_on == self.is_on:
+            return
 
-    def to_html(self):
-        color = "#27ae60" if self.is_on else "#3c3c3c"
-        status = "ON" if self.is_on else "OFF"
+        self.is_on = is_on
+        self.update()
 
-        return f"""
-        <div class="led-widget" style="text-align: center;">
-            <h3>{self.widget_title}</h3>
-            <div style="
-                width: 60px;
-                height: 60px;
-                border-radius: 50%;
-                background: {color};
-                margin: 10px auto;
-                box-shadow: 0 0 20px {color};
-            "></div>
-            <div>{status}</div>
-        </div>
-        """
+    def snapshot_state(self):
+        return {'title': self.widget_title,
+                'color': "#27ae60" if self.is_on else "#3c3c3c",
+                'status': "ON" if self.is_on else "OFF"}
 
 
+@register("button")
 class ButtonWidget(DashboardWidgetBase):
     """Button-Widget zum Auslösen von Aktionen"""
 
+    HTML_TEMPLATE = BUTTON_HTML
+
     clicked = pyqtSignal(str)  # widget_id
 
     def __init__(self, parent=None):
@@ -287,31 +505,22 @@ class ButtonWidget(DashboardWidgetBase):
 
         if 'button_text' in config.get('config', {}):
             self.button_text = config['config']['button_text']
-            self.button.setText(self.button_text)
+            if self.button_text != self.button.text():
+                self.button.setText(self.button_text)
 
         if 'button_command' in config.get('config', {}):
             self.button_command = config['config']['button_command']
 
-    def to_html(self):
-        return f"""
-        <div class="button-widget" style="text-align: center;">
-            <h3>{self.widget_title}</h3>
-            <button style="
-                background: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 15px 30px;
-                font-size: 14px;
-                cursor: pointer;
-            ">{self.button_text}</button>
-        </div>
-        """
+    def snapshot_state(self):
+        return {'title': self.widget_title, 'text': self.button_text}
 
 
+@register("progress_bar")
 class ProgressBarWidget(DashboardWidgetBase):
     """Progress Bar Widget"""
 
+    HTML_TEMPLATE = PROGRESS_HTML
+
     def __init__(self, parent=None):
         super().__init__(title="Progress", parent=parent)
         self.widget_type = "progress_bar"
@@ -346,40 +555,24 @@ class ProgressBarWidget(DashboardWidgetBase):
         else:
             self.current_value = data
 
-        self.progress_bar.setMaximum(int(self.max_value))
-        self.progress_bar.setValue(int(self.current_value))
+        max_value = int(self.max_value)
+        value = int(self.current_value)
+        if max_value != self.progress_bar.maximum():
+            self.progress_bar.setMaximum(max_value)
+        if value != self.progress_bar.value():
+            self.progress_bar.setValue(value)
 
-    def to_html(self):
+    def snapshot_state(self):
         percent = (self.current_value / self.max_value * 100) if self.max_value > 0 else 0
-
-        return f"""
-        <div class="progress-widget">
-            <h3>{self.widget_title}</h3>
-            <div style="
-                width: 100%;
-                height: 30px;
-                background: #2b2b2b;
-                border: 2px solid #555;
-                border-radius: 5px;
-                overflow: hidden;
-            ">
-                <div style="
-                    width: {percent}%;
-                    height: 100%;
-                    background: #27ae60;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    color: white;
-                ">{percent:.0f}%</div>
-            </div>
-        </div>
-        """
+        return {'title': self.widget_title, 'percent': percent}
 
 
+@register("label")
 class LabelWidget(DashboardWidgetBase):
     """Einfaches Text-Label-Widget"""
 
+    HTML_TEMPLATE = LABEL_HTML
+
     def __init__(self, parent=None):
         super().__init__(title="Label", parent=parent)
         self.widget_type = "label"
@@ -403,7 +596,8 @@ class LabelWidget(DashboardWidgetBase):
         else:
             self.label_text = str(data)
 
-        self.text_label.setText(self.label_text)
+        if self.label_text != self.text_label.text():
+            self.text_label.setText(self.label_text)
 
     def set_config(self, config):
         """Setzt Label-Konfiguration"""
@@ -411,21 +605,9 @@ class LabelWidget(DashboardWidgetBase):
 
         if 'label_text' in config.get('config', {}):
             self.label_text = config['config']['label_text']
-            self.text_label.setText(self.label_text)
-
-    def to_html(self):
-        return f"""
-        <div class="label-widget" style="text-align: center; padding: 10px;">
-            <h3>{self.widget_title}</h3>
-            <div style="font-size: 14px;">{self.label_text}</div>
-        </div>
-        """
+            if self.label_text != self.text_label.text():
+                self.text_label.setText(self.label_text)
 
+    def snapshot_state(self):
+        return {'title': self.widget_title, 'text': self.label_text}
 
-# Registriere alle Widget-Typen
-DashboardWidgetFactory.register_widget_type("value_display", ValueDisplayWidget)
-DashboardWidgetFactory.register_widget_type("gauge", GaugeWidget)
-DashboardWidgetFactory.register_widget_type("led", LEDWidget)
-DashboardWidgetFactory.register_widget_type("button", ButtonWidget)
-DashboardWidgetFactory.register_widget_type("progress_bar", ProgressBarWidget)
-DashboardWidgetFactory.register_widget_type("label", LabelWidget)
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QComboBox, QGroupBox, QGridLayout, QTextEdit)
-from PyQt6.QtCore import pyqtSignal, Qt, QDateTime
-from collections import deque
+from PyQt6.QtCore import pyqtSignal, Qt, QDateTime, QTimer, QElapsedTimer
+
+# Status-Stylesheets der Verbindungsanzeige
+STATUS_STYLE_CONNECTED = "font-weight: bold; color: #2ecc71;"
+STATUS_STYLE_DISCONNECTED = "font-weight: bold; color: #e74c3c;"
+
+# Mindestabstand zwischen zwei Anzeige-Updates der Live-Sensoren (~30 Hz)
+SENSOR_UPDATE_INTERVAL_MS = 33
 
 class ConnectionWidget(QGroupBox):
     """Ein Widget zur Verwaltung der seriellen Verbindung auf dem Dashboard."""
@@ -13,6 +19,7 @@ class ConnectionWidget(QGroupBox):
     def __init__(self, parent=None):
         super().__init__("🔌 Verbindung", parent)
         self.setObjectName("DashboardConnectionWidget")
+        self._last_status_state = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -48,22 +55,35 @@ class ConnectionWidget(QGroupBox):
 
     def update_ports(self, ports):
         """Aktualisiert die Liste der verfügbaren COM-Ports."""
-        current = self.port_combo.currentText()
-        self.port_combo.clear()
-        self.port_combo.addItems(ports)
+        ports = list(ports)
+        combo = self.port_combo
+        # Unveränderte Port-Liste: Combo nicht neu aufbauen
+        if [combo.itemText(i) for i in range(combo.count())] == ports:
+            return
+        current = combo.currentText()
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(ports)
         if current in ports:
-            self.port_combo.setCurrentText(current)
+            combo.setCurrentText(current)
+        combo.blockSignals(False)
 
     def update_status(self, is_connected, port_name=""):
         """Aktualisiert den angezeigten Verbindungsstatus."""
+        # Unveränderter Status: kein erneutes Parsen des Stylesheets
+        state = (bool(is_connected), port_name)
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
+
         if is_connected:
             self.status_label.setText(f"Status: Verbunden ({port_name})")
-            self.status_label.setStyleSheet("font-weight: bold; color: #2ecc71;")
+            self.status_label.setStyleSheet(STATUS_STYLE_CONNECTED)
             self.connect_btn.setText("Trennen")
             self.port_combo.setDisabled(True)
         else:
             self.status_label.setText("Status: Getrennt")
-            self.status_label.setStyleSheet("font-weight: bold; color: #e74c3c;")
+            self.status_label.setStyleSheet(STATUS_STYLE_DISCONNECTED)
             self.connect_btn.setText("Verbinden")
             self.port_combo.setDisabled(False)
 
@@ -107,13 +127,20 @@ class QuickSequenceWidget(QGroupBox):
 
     def update_sequences(self, sequences):
         """Aktualisiert die Liste der verfügbaren Sequenzen."""
-        current_id = self.sequence_combo.currentData()
-        self.sequence_combo.clear()
-        for seq_id, seq_data in sequences.items():
-            self.sequence_combo.addItem(seq_data['name'], seq_id)
-        
+        combo = self.sequence_combo
+        items = [(seq_data['name'], seq_id) for seq_id, seq_data in sequences.items()]
+        # Unveränderte Sequenzen: Combo nicht neu aufbauen
+        if [(combo.itemText(i), combo.itemData(i)) for i in range(combo.count())] == items:
+            return
+        current_id = combo.currentData()
+        combo.blockSignals(True)
+        combo.clear()
+        for name, seq_id in items:
+            combo.addItem(name, seq_id)
+
         if current_id in sequences:
-            self.sequence_combo.setCurrentText(sequences[current_id]['name'])
+            combo.setCurrentText(sequences[current_id]['name'])
+        combo.blockSignals(False)
 
 class SensorDisplayWidget(QGroupBox):
     """Eine kompakte Anzeige für Live-Sensordaten."""
@@ -122,6 +149,13 @@ class SensorDisplayWidget(QGroupBox):
         self.setObjectName("DashboardSensorWidget")
         self.setup_ui()
 
+        # Rate-Limit: schnellere Werte werden gesammelt, nur der letzte wird angezeigt
+        self._pending_values = {}  # QLabel -> Text
+        self._last_flush = QElapsedTimer()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_values)
+
     def setup_ui(self):
         layout = QGridLayout(self)
 
@@ -141,34 +175,65 @@ class SensorDisplayWidget(QGroupBox):
         layout.setColumnStretch(1, 1)
 
     def update_temperature(self, value):
-        self.temp_value.setText(f"{value:.1f} °C")
+        self._set_value(self.temp_value, f"{value:.1f} °C")
 
     def update_humidity(self, value):
-        self.humid_value.setText(f"{value:.1f} %")
+        self._set_value(self.humid_value, f"{value:.1f} %")
+
+    def _set_value(self, label, text):
+        """Merkt einen Wert vor und zeigt ihn spätestens nach SENSOR_UPDATE_INTERVAL_MS an."""
+        self._pending_values[label] = text
+        if self._flush_timer.isActive():
+            return
+        remaining = SENSOR_UPDATE_INTERVAL_MS - self._last_flush.elapsed() if self._last_flush.isValid() else 0
+        if remaining <= 0:
+            self._flush_values()
+        else:
+            self._flush_timer.start(remaining)
+
+    def _flush_values(self):
+        """Zeigt die zuletzt vorgemerkten Werte an (nur geänderte Texte)."""
+        self._last_flush.start()
+        for label, text in self._pending_values.items():
+            if label.text() != text:
+                label.setText(text)
+        self._pending_values.clear()
 
 class RecentActivityWidget(QGroupBox):
     """Ein Widget, das die letzten wichtigen Aktivitäten anzeigt."""
+    MAX_ENTRIES = 20
+
     def __init__(self, parent=None):
         super().__init__("🕒 Letzte Aktivitäten", parent)
         self.setObjectName("DashboardActivityWidget")
-        self.log_entries = deque(maxlen=20)
+        self._pending_entries = []
         self.setup_ui()
 
+        # Mehrere Einträge kurz hintereinander ergeben nur ein Neuzeichnen
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_entries)
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
         self.log_display.setStyleSheet("font-size: 10px; color: #bdc3c7;")
+        # Das Dokument dient als Ringpuffer: älteste Zeilen fallen oben heraus
+        self.log_display.document().setMaximumBlockCount(self.MAX_ENTRIES)
         layout.addWidget(self.log_display)
 
     def add_entry(self, message):
         """Fügt einen neuen Eintrag zum Aktivitätslog hinzu."""
         timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
-        formatted_message = f"[{timestamp}] {message}"
-        self.log_entries.appendleft(formatted_message)
-        self.update_display()
-
-    def update_display(self):
-        """Aktualisiert die Textanzeige."""
-        self.log_display.setHtml("<br>".join(self.log_entries))
-
+        self._pending_entries.append(f"[{timestamp}] {message}")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_entries(self):
+        """Hängt gesammelte Einträge an (neueste unten), ohne das Dokument neu aufzubauen."""
+        entries = self._pending_entries[-self.MAX_ENTRIES:]
+        self._pending_entries = []
+        for entry in entries:
+            self.log_display.append(entry)
@@ -3,85 +3,400 @@
 Erweiterter Daten-Logger mit CSV-Export und Trigger-Funktionen
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-                             QPushButton, QLabel, QTableWidget, QTableWidgetItem,
+                             QPushButton, QLabel, QTableView,
                              QCheckBox, QSpinBox, QComboBox, QFileDialog, QMessageBox,
-                             QSplitter, QTextEdit, QHeaderView)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QDateTime
+                             QSplitter, QScrollArea, QHeaderView, QProgressDialog)
+from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, QAbstractTableModel,
+                          QModelIndex, QObject, QRunnable, QThreadPool)
 from PyQt6.QtGui import QColor
 import csv
+import json
+import sys
 import time
 from collections import deque
-from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from functools import partial
+from itertools import islice
+from typing import List, Dict, Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_json_record(record: Dict[str, Any]) -> str:
+    """Serialisiert einen Export-Datensatz mit 2er-Einrückung (orjson, falls verfügbar)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(record, indent=2)
+
+
+# Zuletzt formatierte Sekunde: [Sekunde, "yyyy-MM-dd hh:mm:ss"]
+_second_text_cache = [None, ""]
+
+
+def format_log_time(timestamp: float) -> str:
+    """Formatiert einen Zeitstempel wie QDateTime mit 'yyyy-MM-dd hh:mm:ss.zzz'"""
+    msecs = int(timestamp * 1000)
+    seconds = msecs // 1000
+    # strftime nur beim Sekundenwechsel, sonst nur die Millisekunden anhängen
+    if seconds != _second_text_cache[0]:
+        _second_text_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+        _second_text_cache[0] = seconds
+    return _second_text_cache[1] + ".%03d" % (msecs % 1000)
+
 
-@dataclass
 class LogEntry:
-    """Ein einzelner Log-Eintrag"""
-    timestamp: float
-    pin_name: str
-    value: Any
-    event_type: str  # "change", "threshold", "periodic"
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    """Ein einzelner Log-Eintrag (__slots__, da bis zu 10.000 Einträge gehalten werden)"""
+
+    __slots__ = ("timestamp", "pin_name", "value", "event_type", "metadata", "_dt_str")
+
+    def __init__(self, timestamp: float, pin_name: str, value: Any, event_type: str,
+                 metadata: Optional[Dict[str, Any]] = None):
+        self.timestamp = timestamp
+        self.pin_name = pin_name
+        self.value = value
+        self.event_type = event_type  # "change", "threshold", "periodic"
+        self.metadata = metadata  # Meist leer, daher erst bei Bedarf ein Dict
+        # Datum/Uhrzeit wird einmal beim Anlegen formatiert (Tabelle, Export)
+        self._dt_str = format_log_time(timestamp)
+
+    def __repr__(self):
+        return (f"LogEntry(timestamp={self.timestamp!r}, pin_name={self.pin_name!r}, "
+                f"value={self.value!r}, event_type={self.event_type!r}, metadata={self.metadata!r})")
     
     def to_dict(self):
-        return {
+        data = {
             "timestamp": self.timestamp,
-            "datetime": QDateTime.fromMSecsSinceEpoch(int(self.timestamp * 1000)).toString("yyyy-MM-dd hh:mm:ss.zzz"),
+            "datetime": self._dt_str,
             "pin": self.pin_name,
             "value": self.value,
             "type": self.event_type,
-            **self.metadata
         }
+        if self.metadata:
+            data.update(self.metadata)
+        return data
+
+
+# Auswählbare Pins (interniert wie die Pin-Namen in log_pin_value)
+PIN_NAMES = tuple(sys.intern(name) for name in
+                  [f"D{i}" for i in range(14)] + [f"A{i}" for i in range(6)])
+
+# Anzahl der in der Tabelle angezeigten (neuesten) Einträge
+DISPLAY_ROWS = 100
+
+# Platzhalter für "Pin noch ohne Wert" (None ist ein gültiger Pin-Wert)
+_MISSING = object()
+
+# Geschätzte Größe einer CSV-Zeile ohne Pin und Typ (Zeitstempel, Datum/Uhrzeit, Wert, Trennzeichen)
+LOG_ENTRY_BASE_BYTES = 48
+
+
+def estimate_entry_bytes(entry: LogEntry) -> int:
+    """Ungefähre Größe eines Eintrags im Export"""
+    return LOG_ENTRY_BASE_BYTES + len(entry.pin_name) + len(entry.event_type)
 
 
 class TriggerCondition:
-    """Trigger-Bedingung für automatisches Logging"""
-    def __init__(self, pin: str, operator: str, threshold: float):
+    """Trigger-Bedingung für automatisches Logging (Basis, je Operator eine Unterklasse)"""
+
+    __slots__ = ("pin", "threshold")
+    operator = ""  # ">", "<", "==", "!=", "change"
+
+    def __init__(self, pin: str, threshold: float):
         self.pin = pin
-        self.operator = operator  # ">", "<", "==", "!=", "change"
         self.threshold = threshold
-        self.last_value = None
     
     def check(self, pin: str, value: float) -> bool:
         """Prüft, ob die Trigger-Bedingung erfüllt ist"""
-        if pin != self.pin:
-            return False
-        
-        if self.operator == "change":
-            triggered = self.last_value is not None and self.last_value != value
-            self.last_value = value
-            return triggered
-        elif self.operator == ">":
-            return value > self.threshold
-        elif self.operator == "<":
-            return value < self.threshold
-        elif self.operator == "==":
-            return value == self.threshold
-        elif self.operator == "!=":
-            return value != self.threshold
-        
+        return pin == self.pin and self.matches(value)
+
+    def matches(self, value) -> bool:
+        """Prüft einen Wert des eigenen Pins"""
         return False
 
 
+class GreaterTrigger(TriggerCondition):
+    __slots__ = ()
+    operator = ">"
+
+    def matches(self, value) -> bool:
+        return value > self.threshold
+
+
+class LessTrigger(TriggerCondition):
+    __slots__ = ()
+    operator = "<"
+
+    def matches(self, value) -> bool:
+        return value < self.threshold
+
+
+class EqualTrigger(TriggerCondition):
+    __slots__ = ()
+    operator = "=="
+
+    def matches(self, value) -> bool:
+        return value == self.threshold
+
+
+class NotEqualTrigger(TriggerCondition):
+    __slots__ = ()
+    operator = "!="
+
+    def matches(self, value) -> bool:
+        return value != self.threshold
+
+
+class ChangeTrigger(TriggerCondition):
+    __slots__ = ("last_value",)
+    operator = "change"
+
+    def __init__(self, pin: str, threshold: float):
+        super().__init__(pin, threshold)
+        self.last_value = None
+
+    def matches(self, value) -> bool:
+        triggered = self.last_value is not None and self.last_value != value
+        self.last_value = value
+        return triggered
+
+
+# Operator -> Trigger-Klasse
+TRIGGER_TYPES = {cls.operator: cls for cls in
+                 (GreaterTrigger, LessTrigger, EqualTrigger, NotEqualTrigger, ChangeTrigger)}
+
+
+def create_trigger(pin: str, operator: str, threshold: float) -> TriggerCondition:
+    """Erzeugt die passende Trigger-Bedingung für operator"""
+    return TRIGGER_TYPES.get(operator, TriggerCondition)(pin, threshold)
+
+
+def _default_export_name(ext: str) -> str:
+    """Vorgeschlagener Dateiname für Exporte, z.B. log_20240101_120000.csv"""
+    return f"log_{time.strftime('%Y%m%d_%H%M%S')}.{ext}"
+
+
+# Zeilen pro Block beim Export (danach flush und Fortschrittsmeldung)
+EXPORT_CHUNK_ROWS = 10_000
+
+
+def write_csv_export(file_path: str, entries, progress=None):
+    """Schreibt Log-Einträge blockweise als CSV; progress(anzahl) nach jedem Block"""
+    rows = ((e.timestamp, e._dt_str, e.pin_name, e.value, e.event_type) for e in entries)
+    written = 0
+    with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(("timestamp", "datetime", "pin", "value", "type"))
+        while True:
+            chunk = list(islice(rows, EXPORT_CHUNK_ROWS))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            f.flush()
+            written += len(chunk)
+            if progress:
+                progress(written)
+
+
+def write_json_export(file_path: str, entries, progress=None):
+    """Schreibt Log-Einträge als JSON-Liste; progress(anzahl) alle EXPORT_CHUNK_ROWS Einträge"""
+    # Eintrag für Eintrag schreiben statt erst die komplette Liste aufzubauen
+    with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write("[")
+        separator = "\n  "
+        written = 0
+        for written, entry in enumerate(entries, 1):
+            f.write(separator)
+            f.write(_dump_json_record(entry.to_dict()).replace("\n", "\n  "))
+            separator = ",\n  "
+            if progress and written % EXPORT_CHUNK_ROWS == 0:
+                progress(written)
+        f.write("\n]" if written else "]")  # Leere Liste wie json.dump: "[]"
+    if progress:
+        progress(len(entries))
+
+
+def write_excel_export(file_path: str, entries, progress=None):
+    """Schreibt Log-Einträge als Excel-Datei (benötigt openpyxl); progress wie bei JSON"""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment
+
+    # Write-Only-Modus: Zeilen werden direkt gestreamt statt als Cell-Objekte gehalten
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Datenlog")
+
+    # Spaltenbreiten anpassen (im Write-Only-Modus vor der ersten Zeile)
+    ws.column_dimensions['A'].width = 15
+    ws.column_dimensions['B'].width = 22
+    ws.column_dimensions['C'].width = 10
+    ws.column_dimensions['D'].width = 12
+    ws.column_dimensions['E'].width = 12
+
+    # Header (formatiert)
+    header_cells = []
+    for header in ("Zeitstempel", "Datum/Uhrzeit", "Pin", "Wert", "Typ"):
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = Font(bold=True)
+        cell.alignment = Alignment(horizontal='center')
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    # Daten
+    for written, e in enumerate(entries, 1):
+        ws.append((e.timestamp, e._dt_str, e.pin_name, e.value, e.event_type))
+        if progress and written % EXPORT_CHUNK_ROWS == 0:
+            progress(written)
+
+    wb.save(file_path)
+    if progress:
+        progress(len(entries))
+
+
+class _ExportSignals(QObject):
+    """Signale eines Hintergrund-Exports"""
+
+    progress = pyqtSignal(int)  # Anzahl geschriebener Einträge
+    finished = pyqtSignal(str, str)  # file_path, Fehlermeldung ('' = Erfolg)
+
+
+class _ExportJob(QRunnable):
+    """Führt write_fn(file_path, entries, progress) außerhalb des GUI-Threads aus"""
+
+    def __init__(self, file_path: str, write_fn, entries):
+        super().__init__()
+        self.file_path = file_path
+        self.write_fn = write_fn
+        self.entries = entries
+        self.signals = _ExportSignals()
+
+    def run(self):
+        try:
+            self.write_fn(self.file_path, self.entries, self.signals.progress.emit)
+        except Exception as e:
+            self.signals.finished.emit(self.file_path, str(e))
+        else:
+            self.signals.finished.emit(self.file_path, "")
+
+
+class LogTableModel(QAbstractTableModel):
+    """
+    Tabellen-Modell für die letzten Log-Einträge
+
+    Die View fragt nur sichtbare Zellen ab; bei jedem Update wird lediglich
+    die Eintragsliste getauscht. Bestehende Zeilen werden per dataChanged
+    weiterverwendet, zurückgesetzt wird nur, wenn die Tabelle schrumpft.
+    """
+
+    HEADERS = ("Zeit", "Datum/Uhrzeit", "Pin", "Wert", "Typ")
+    ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    TRIGGER_FOREGROUND = QColor("#e74c3c")
+    TRIGGER_BACKGROUND = QColor("#2c1a1a")
+
+    def __init__(self, cap: int = DISPLAY_ROWS, parent=None):
+        super().__init__(parent)
+        self._cap = cap
+        self._entries: List[LogEntry] = []
+        self._start_time = 0.0
+
+    def set_entries(self, entries, start_time: float):
+        """Übernimmt die letzten cap Einträge als Snapshot"""
+        # Nur die letzten cap Einträge anfassen statt den ganzen Puffer zu kopieren
+        new_entries = list(islice(reversed(entries), self._cap))[::-1]
+        old_count = len(self._entries)
+        new_count = len(new_entries)
+
+        if new_count < old_count:
+            self.beginResetModel()
+            self._entries = new_entries
+            self._start_time = start_time
+            self.endResetModel()
+            return
+
+        # Vorhandene Zeilen behalten, nur neue Zeilen anhängen
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._entries = new_entries
+            self._start_time = start_time
+            self.endInsertRows()
+        else:
+            self._entries = new_entries
+            self._start_time = start_time
+        if old_count:
+            self.dataChanged.emit(self.index(0, 0), self.index(old_count - 1, len(self.HEADERS) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                # Zeit (Sekunden seit Start)
+                return f"{entry.timestamp - self._start_time:.3f}"
+            if column == 1:
+                return entry._dt_str
+            if column == 2:
+                return entry.pin_name
+            if column == 3:
+                return str(entry.value)
+            return entry.event_type
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self.ALIGN_RIGHT if column in (0, 3) else None
+
+        # Typ mit Farbe
+        if column == 4 and entry.event_type == "trigger":
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.TRIGGER_FOREGROUND
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self.TRIGGER_BACKGROUND
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class DataLoggerWidget(QWidget):
     """Erweiterter Datenlogger mit Trigger-Funktionen"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.log_entries: deque = deque(maxlen=10000)  # Letzte 10.000 Einträge
+        self._display_window: deque = deque(maxlen=DISPLAY_ROWS)  # Die neuesten Einträge für die Tabelle
         self.triggers: List[TriggerCondition] = []
+        self.triggers_by_pin: Dict[str, List[TriggerCondition]] = {}  # Pin -> Trigger (für log_pin_value)
         self.recording = False
         self.start_time = time.time()
         
         self.watched_pins = set()
         self.pin_states = {}
+        self._dirty = False  # Neue Einträge seit dem letzten Tabellen-Update
+        self._approx_bytes = 0  # Geschätzte Größe aller gepufferten Einträge
+        
+        # Exporte laufen nacheinander im Hintergrund
+        self._export_pool = QThreadPool(self)
+        self._export_pool.setMaxThreadCount(1)
+        self._pending_exports = set()
         
         self.setup_ui()
         
-        # Auto-Update Timer
+        # Auto-Update Timer (läuft nur während der Aufzeichnung)
         self.update_timer = QTimer(self)
+        self.update_timer.setInterval(500)  # 2x pro Sekunde
         self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(500)  # 2x pro Sekunde
     
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -138,7 +453,7 @@ class DataLoggerWidget(QWidget):
         
         pin_btn_layout = QHBoxLayout()
         self.pin_combo = QComboBox()
-        self.pin_combo.addItems([f"D{i}" for i in range(14)] + [f"A{i}" for i in range(6)])
+        self.pin_combo.addItems(PIN_NAMES)
         pin_btn_layout.addWidget(self.pin_combo)
         
         add_pin_btn = QPushButton("➕")
@@ -146,10 +461,7 @@ class DataLoggerWidget(QWidget):
         pin_btn_layout.addWidget(add_pin_btn)
         pin_layout.addLayout(pin_btn_layout)
         
-        self.watched_pins_list = QTextEdit()
-        self.watched_pins_list.setReadOnly(True)
-        self.watched_pins_list.setMaximumHeight(100)
-        pin_layout.addWidget(self.watched_pins_list)
+        self.watched_pins_list = self._add_list_label(pin_layout)
         
         config_splitter.addWidget(pin_group)
         
@@ -160,7 +472,7 @@ class DataLoggerWidget(QWidget):
         trigger_config_layout = QHBoxLayout()
         
         self.trigger_pin_combo = QComboBox()
-        self.trigger_pin_combo.addItems([f"D{i}" for i in range(14)] + [f"A{i}" for i in range(6)])
+        self.trigger_pin_combo.addItems(PIN_NAMES)
         trigger_config_layout.addWidget(self.trigger_pin_combo)
         
         self.trigger_operator_combo = QComboBox()
@@ -177,10 +489,7 @@ class DataLoggerWidget(QWidget):
         
         trigger_layout.addLayout(trigger_config_layout)
         
-        self.trigger_list = QTextEdit()
-        self.trigger_list.setReadOnly(True)
-        self.trigger_list.setMaximumHeight(100)
-        trigger_layout.addWidget(self.trigger_list)
+        self.trigger_list = self._add_list_label(trigger_layout)
         
         config_splitter.addWidget(trigger_group)
         control_layout.addWidget(config_splitter)
@@ -196,6 +505,12 @@ class DataLoggerWidget(QWidget):
         self.log_changes_only_check.setChecked(True)
         options_layout.addWidget(self.log_changes_only_check)
         
+        # Zustände als Python-Bools spiegeln (log_pin_value fragt sie pro Wert ab)
+        self._log_all = self.log_all_check.isChecked()
+        self._log_changes_only = self.log_changes_only_check.isChecked()
+        self.log_all_check.toggled.connect(self._on_log_all_toggled)
+        self.log_changes_only_check.toggled.connect(self._on_log_changes_only_toggled)
+        
         options_layout.addWidget(QLabel("Intervall:"))
         self.interval_spin = QSpinBox()
         self.interval_spin.setRange(10, 10000)
@@ -237,10 +552,10 @@ class DataLoggerWidget(QWidget):
         
         data_layout.addLayout(export_layout)
         
-        # Daten-Tabelle
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(5)
-        self.data_table.setHorizontalHeaderLabels(["Zeit", "Datum/Uhrzeit", "Pin", "Wert", "Typ"])
+        # Daten-Tabelle (Model/View, zeigt die letzten DISPLAY_ROWS Einträge)
+        self.log_model = LogTableModel(DISPLAY_ROWS, self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.log_model)
         self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.data_table.setAlternatingRowColors(True)
         data_layout.addWidget(self.data_table)
@@ -250,16 +565,36 @@ class DataLoggerWidget(QWidget):
         
         main_layout.addWidget(splitter)
     
+    @staticmethod
+    def _add_list_label(layout) -> QLabel:
+        """Schlanke, scrollbare Textanzeige für Pin-/Trigger-Listen (statt eines QTextEdit)"""
+        label = QLabel()
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setWordWrap(True)
+        label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(label)
+        scroll.setMaximumHeight(100)
+        layout.addWidget(scroll)
+        return label
+    
+    def _on_log_all_toggled(self, checked: bool):
+        self._log_all = checked
+    
+    def _on_log_changes_only_toggled(self, checked: bool):
+        self._log_changes_only = checked
+    
     def add_watched_pin(self):
         """Fügt einen Pin zur Überwachungsliste hinzu"""
-        pin = self.pin_combo.currentText()
+        pin = sys.intern(self.pin_combo.currentText())
         if pin not in self.watched_pins:
             self.watched_pins.add(pin)
             self.update_watched_pins_display()
     
     def add_trigger(self):
         """Fügt eine Trigger-Bedingung hinzu"""
-        pin = self.trigger_pin_combo.currentText()
+        pin = sys.intern(self.trigger_pin_combo.currentText())
         operator_text = self.trigger_operator_combo.currentText()
         
         operator_map = {
@@ -272,20 +607,21 @@ class DataLoggerWidget(QWidget):
         operator = operator_map[operator_text]
         threshold = self.trigger_value_spin.value()
         
-        trigger = TriggerCondition(pin, operator, threshold)
+        trigger = create_trigger(pin, operator, threshold)
         self.triggers.append(trigger)
+        self.triggers_by_pin.setdefault(pin, []).append(trigger)
         self.update_triggers_display()
     
     def update_watched_pins_display(self):
         """Aktualisiert die Anzeige der überwachten Pins"""
-        self.watched_pins_list.setPlainText(", ".join(sorted(self.watched_pins)))
+        self.watched_pins_list.setText(", ".join(sorted(self.watched_pins)))
     
     def update_triggers_display(self):
         """Aktualisiert die Anzeige der Trigger"""
         trigger_texts = []
         for i, trigger in enumerate(self.triggers, 1):
             trigger_texts.append(f"{i}. {trigger.pin} {trigger.operator} {trigger.threshold}")
-        self.trigger_list.setPlainText("\n".join(trigger_texts))
+        self.trigger_list.setText("\n".join(trigger_texts))
     
     def toggle_recording(self):
         """Startet/Stoppt die Aufzeichnung"""
@@ -296,23 +632,29 @@ class DataLoggerWidget(QWidget):
             self.status_label.setText("Aufzeichnung läuft...")
             self.start_btn.setText("⏸️ Aufzeichnung stoppen")
             self.start_time = time.time()
+            self.update_timer.start()
         else:
             self.status_indicator.setText("⏸️")
             self.status_label.setText("Pausiert")
             self.start_btn.setText("🔴 Aufzeichnung starten")
+            self.update_timer.stop()
     
     def log_pin_value(self, pin_name: str, value: Any):
         """Loggt einen Pin-Wert (wird von außen aufgerufen)"""
         if not self.recording:
             return
         
+        # Pin-Namen teilen sich über alle Einträge ein String-Objekt
+        pin_name = sys.intern(pin_name)
+        
         # Prüfen, ob der Pin überwacht werden soll
-        if not self.log_all_check.isChecked() and pin_name not in self.watched_pins:
+        if not self._log_all and pin_name not in self.watched_pins:
             return
         
         # Nur Änderungen loggen?
-        if self.log_changes_only_check.isChecked():
-            if pin_name in self.pin_states and self.pin_states[pin_name] == value:
+        if self._log_changes_only:
+            previous = self.pin_states.get(pin_name, _MISSING)
+            if previous is not _MISSING and previous == value:
                 return
         
         self.pin_states[pin_name] = value
@@ -320,9 +662,9 @@ class DataLoggerWidget(QWidget):
         # Event-Typ bestimmen
         event_type = "periodic"
         
-        # Trigger prüfen
-        for trigger in self.triggers:
-            if trigger.check(pin_name, value):
+        # Trigger prüfen (nur die des Pins)
+        for trigger in self.triggers_by_pin.get(pin_name, ()):
+            if trigger.matches(value):
                 event_type = "trigger"
                 break
         
@@ -334,11 +676,22 @@ class DataLoggerWidget(QWidget):
             event_type=event_type
         )
         
+        # Größe mitführen; bei vollem Puffer verdrängt append den ältesten Eintrag
+        if len(self.log_entries) == self.log_entries.maxlen:
+            self._approx_bytes -= estimate_entry_bytes(self.log_entries[0])
         self.log_entries.append(entry)
+        self._display_window.append(entry)
+        self._approx_bytes += estimate_entry_bytes(entry)
+        self._dirty = True
+    
+    def showEvent(self, event):
+        """Holt beim Einblenden die ausgelassenen Updates nach"""
+        super().showEvent(event)
+        self.update_display()
     
     def update_display(self):
-        """Aktualisiert die Anzeige"""
-        if not self.recording:
+        """Aktualisiert die Anzeige (nur sichtbar; Tabelle nur bei neuen Einträgen)"""
+        if not self.recording or not self.isVisible():
             return
         
         # Statistiken
@@ -350,39 +703,15 @@ class DataLoggerWidget(QWidget):
         self.duration_label.setText(f"Dauer: {int(duration // 60):02d}:{int(duration % 60):02d}")
         self.rate_label.setText(f"Rate: {rate:.1f} Hz")
         
-        # Geschätzte Größe
-        estimated_size = count * 50 / 1024  # ~50 Bytes pro Eintrag
-        self.size_label.setText(f"Größe: {estimated_size:.1f} KB")
-        
-        # Tabelle aktualisieren (nur letzte 100 Einträge)
-        display_entries = list(self.log_entries)[-100:]
-        self.data_table.setRowCount(len(display_entries))
-        
-        for row, entry in enumerate(display_entries):
-            data = entry.to_dict()
-            
-            # Zeit (Sekunden seit Start)
-            time_item = QTableWidgetItem(f"{entry.timestamp - self.start_time:.3f}")
-            time_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.data_table.setItem(row, 0, time_item)
-            
-            # Datum/Uhrzeit
-            self.data_table.setItem(row, 1, QTableWidgetItem(data["datetime"]))
-            
-            # Pin
-            self.data_table.setItem(row, 2, QTableWidgetItem(data["pin"]))
-            
-            # Wert
-            value_item = QTableWidgetItem(str(data["value"]))
-            value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.data_table.setItem(row, 3, value_item)
-            
-            # Typ mit Farbe
-            type_item = QTableWidgetItem(data["type"])
-            if data["type"] == "trigger":
-                type_item.setForeground(QColor("#e74c3c"))
-                type_item.setBackground(QColor("#2c1a1a"))
-            self.data_table.setItem(row, 4, type_item)
+        # Geschätzte Größe (beim Loggen mitgeführt)
+        self.size_label.setText(f"Größe: {self._approx_bytes / 1024:.1f} KB")
+        
+        if not self._dirty:
+            return
+        self._dirty = False
+        
+        # Tabelle aktualisieren (nur das kleine Anzeige-Fenster, Zellen liefert das Modell)
+        self.log_model.set_entries(self._display_window, self.start_time)
         
         # Auto-Scroll
         if self.auto_scroll.isChecked():
@@ -398,8 +727,43 @@ class DataLoggerWidget(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.log_entries.clear()
+            self._display_window.clear()
+            self._approx_bytes = 0
             self.pin_states.clear()
-            self.data_table.setRowCount(0)
+            self.log_model.set_entries((), self.start_time)
+    
+    def _start_export(self, file_path: str, write_fn):
+        """Schreibt einen Snapshot der Einträge im Hintergrund (write_fn(file_path, entries, progress))"""
+        entries = tuple(self.log_entries)
+        job = _ExportJob(file_path, write_fn, entries)
+        
+        # Fortschritt (erscheint nur bei länger laufenden Exporten)
+        progress_dialog = QProgressDialog("Exportiere Daten...", None, 0, len(entries), self)
+        progress_dialog.setWindowTitle("Export")
+        progress_dialog.setValue(0)
+        job.signals.progress.connect(progress_dialog.setValue)
+        job.signals.finished.connect(progress_dialog.close)
+        job.signals.finished.connect(progress_dialog.deleteLater)
+        
+        self._pending_exports.add(job)
+        job.signals.finished.connect(partial(self._on_export_finished, len(entries)))
+        job.signals.finished.connect(partial(self._pending_exports.discard, job))
+        self._export_pool.start(job)
+    
+    def wait_for_exports(self, msecs: int = -1) -> bool:
+        """Wartet, bis alle Hintergrund-Exporte abgeschlossen sind"""
+        return self._export_pool.waitForDone(msecs)
+    
+    def _on_export_finished(self, count: int, file_path: str, error: str):
+        """Abschluss eines Exports (GUI-Thread)"""
+        if error:
+            QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen:\n{error}")
+            return
+        
+        QMessageBox.information(
+            self, "Erfolg",
+            f"{count} Einträge wurden nach {file_path} exportiert!"
+        )
     
     def export_csv(self):
         """Exportiert die Daten als CSV"""
@@ -409,24 +773,12 @@ class DataLoggerWidget(QWidget):
         
         file_path, _ = QFileDialog.getSaveFileName(
             self, "CSV exportieren",
-            f"log_{QDateTime.currentDateTime().toString('yyyyMMdd_hhmmss')}.csv",
+            _default_export_name("csv"),
             "CSV (*.csv)"
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=["timestamp", "datetime", "pin", "value", "type"])
-                    writer.writeheader()
-                    for entry in self.log_entries:
-                        writer.writerow(entry.to_dict())
-                
-                QMessageBox.information(
-                    self, "Erfolg",
-                    f"{len(self.log_entries)} Einträge wurden nach {file_path} exportiert!"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen:\n{e}")
+            self._start_export(file_path, write_csv_export)
     
     def export_json(self):
         """Exportiert die Daten als JSON"""
@@ -436,23 +788,12 @@ class DataLoggerWidget(QWidget):
         
         file_path, _ = QFileDialog.getSaveFileName(
             self, "JSON exportieren",
-            f"log_{QDateTime.currentDateTime().toString('yyyyMMdd_hhmmss')}.json",
+            _default_export_name("json"),
             "JSON (*.json)"
         )
         
         if file_path:
-            try:
-                import json
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    data = [entry.to_dict() for entry in self.log_entries]
-                    json.dump(data, f, indent=2)
-                
-                QMessageBox.information(
-                    self, "Erfolg",
-                    f"{len(self.log_entries)} Einträge wurden nach {file_path} exportiert!"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen:\n{e}")
+            self._start_export(file_path, write_json_export)
     
     def export_excel(self):
         """Exportiert die Daten als Excel"""
@@ -461,8 +802,7 @@ class DataLoggerWidget(QWidget):
             return
         
         try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment
+            import openpyxl  # noqa: F401 - nur Verfügbarkeit prüfen, geschrieben wird im Hintergrund
         except ImportError:
             QMessageBox.critical(
                 self, "Fehler",
@@ -472,48 +812,9 @@ class DataLoggerWidget(QWidget):
         
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Excel exportieren",
-            f"log_{QDateTime.currentDateTime().toString('yyyyMMdd_hhmmss')}.xlsx",
+            _default_export_name("xlsx"),
             "Excel (*.xlsx)"
         )
         
         if file_path:
-            try:
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "Datenlog"
-                
-                # Header
-                headers = ["Zeitstempel", "Datum/Uhrzeit", "Pin", "Wert", "Typ"]
-                ws.append(headers)
-                
-                # Header formatieren
-                for cell in ws[1]:
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center')
-                
-                # Daten
-                for entry in self.log_entries:
-                    data = entry.to_dict()
-                    ws.append([
-                        data["timestamp"],
-                        data["datetime"],
-                        data["pin"],
-                        data["value"],
-                        data["type"]
-                    ])
-                
-                # Spaltenbreiten anpassen
-                ws.column_dimensions['A'].width = 15
-                ws.column_dimensions['B'].width = 22
-                ws.column_dimensions['C'].width = 10
-                ws.column_dimensions['D'].width = 12
-                ws.column_dimensions['E'].width = 12
-                
-                wb.save(file_path)
-                
-                QMessageBox.information(
-                    self, "Erfolg",
-                    f"{len(self.log_entries)} Einträge wurden nach {file_path} exportiert!"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen:\n{e}")
+            self._start_export(file_path, write_excel_export)
@@ -5,10 +5,11 @@ Alle Features der App in einer übersichtlichen Ansicht
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QMdiArea, QMdiSubWindow,
                              QPushButton, QHBoxLayout, QComboBox, QLabel, QInputDialog,
-                             QCheckBox, QMenu, QDialog, QListWidget, QListWidgetItem,
+                             QToolButton, QMenu, QDialog, QListWidget, QListWidgetItem,
                              QDialogButtonBox, QGroupBox, QGridLayout, QMessageBox)
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QSignalBlocker
 from PyQt6.QtGui import QAction
+from typing import NamedTuple, Optional
 
 from .dashboard_widgets import (ConnectionWidget, QuickSequenceWidget,
                                 SensorDisplayWidget, RecentActivityWidget)
@@ -16,8 +17,16 @@ from .pin_overview_widget import PinOverviewWidget
 from .live_chart_widget import LiveChartWidget
 from .sequence_info_widget import SequenceInfoWidget
 
+class WidgetDefinition(NamedTuple):
+    """Unveränderliche Beschreibung eines Dashboard-Widgets (Klasse, Beschriftung, Standard-Geometrie)."""
+    cls: type
+    title: str
+    icon: str
+    geom: tuple  # (x, y, w, h)
+    category: str
+    init_args: Optional[dict] = None
+
 class WidgetSelectorDialog(QDialog):
-    # Unverändert
     def __init__(self, available_widgets, visible_widgets, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Dashboard-Widgets verwalten")
@@ -30,11 +39,17 @@ class WidgetSelectorDialog(QDialog):
         info = QLabel("Wähle die Widgets aus, die im Dashboard angezeigt werden sollen:")
         info.setWordWrap(True); layout.addWidget(info)
         self.widget_list = QListWidget()
-        for widget_id, widget_info in self.available_widgets.items():
-            item = QListWidgetItem(f"{widget_info['icon']} {widget_info['title']}")
-            item.setData(Qt.ItemDataRole.UserRole, widget_id)
-            item.setCheckState(Qt.CheckState.Checked if widget_id in self.visible_widgets else Qt.CheckState.Unchecked)
-            self.widget_list.addItem(item)
+        self._items = []  # Python-seitige Liste der Einträge, spart item(i)-Aufrufe beim (Ab-)Wählen
+        self.widget_list.setUpdatesEnabled(False)  # Ein Relayout statt eines pro Eintrag
+        try:
+            with QSignalBlocker(self.widget_list):
+                for widget_id, widget_info in self.available_widgets.items():
+                    item = QListWidgetItem(f"{widget_info.icon} {widget_info.title}")
+                    item.setData(Qt.ItemDataRole.UserRole, widget_id)
+                    item.setCheckState(Qt.CheckState.Checked if widget_id in self.visible_widgets else Qt.CheckState.Unchecked)
+                    self.widget_list.addItem(item); self._items.append(item)
+        finally:
+            self.widget_list.setUpdatesEnabled(True)
         layout.addWidget(self.widget_list)
         btn_layout = QHBoxLayout()
         select_all_btn = QPushButton("Alle auswählen"); select_all_btn.clicked.connect(self.select_all); btn_layout.addWidget(select_all_btn)
@@ -43,15 +58,14 @@ class WidgetSelectorDialog(QDialog):
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         button_box.accepted.connect(self.accept); button_box.rejected.connect(self.reject); layout.addWidget(button_box)
     def select_all(self):
-        for i in range(self.widget_list.count()): self.widget_list.item(i).setCheckState(Qt.CheckState.Checked)
+        checked = Qt.CheckState.Checked
+        for item in self._items: item.setCheckState(checked)
     def deselect_all(self):
-        for i in range(self.widget_list.count()): self.widget_list.item(i).setCheckState(Qt.CheckState.Unchecked)
+        unchecked = Qt.CheckState.Unchecked
+        for item in self._items: item.setCheckState(unchecked)
     def get_selected_widgets(self):
-        selected = set()
-        for i in range(self.widget_list.count()):
-            item = self.widget_list.item(i)
-            if item.checkState() == Qt.CheckState.Checked: selected.add(item.data(Qt.ItemDataRole.UserRole))
-        return selected
+        checked, user_role = Qt.CheckState.Checked, Qt.ItemDataRole.UserRole
+        return {item.data(user_role) for item in self._items if item.checkState() == checked}
 
 class EnhancedDashboardTab(QWidget):
     # Signale unverändert
@@ -64,22 +78,26 @@ class EnhancedDashboardTab(QWidget):
     layout_delete_requested = pyqtSignal(str)
     layout_load_requested = pyqtSignal(str)
 
+    IMPORTANT_WIDGETS = ('pin_overview', 'live_chart', 'sensor_display', 'sequence_info')  # Schnellzugriff, ohne led_matrix, pwm_quick
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.widgets = {}
         self.mdi_area = QMdiArea()
         self.visible_widgets = set()
         self.edit_mode = False  # Edit Mode state
+        self._last_layout_snapshot = None  # (Geometrien, Sichtbarkeit) der letzten Layout-Abfrage
+        self._last_layout_config = None
 
         # Widget-Definitionen OHNE LED Matrix und PWM Quick
         self.widget_definitions = {
-            'connection': {'class': ConnectionWidget, 'title': 'Verbindung', 'icon': '🔌', 'geom': (10, 10, 280, 220), 'category': 'Basis'},
-            'quick_sequence': {'class': QuickSequenceWidget, 'title': 'Schnellstart', 'icon': '⚙️', 'geom': (10, 240, 280, 200), 'category': 'Basis'},
-            'activity': {'class': RecentActivityWidget, 'title': 'Aktivitäten', 'icon': '🕒', 'geom': (10, 450, 280, 200), 'category': 'Basis'},
-            'sensor_display': {'class': SensorDisplayWidget, 'title': 'Live Sensoren', 'icon': '🌡️', 'geom': (300, 10, 280, 130), 'category': 'Sensoren'},
-            'pin_overview': {'class': PinOverviewWidget, 'title': 'Pin Übersicht', 'icon': '📊', 'geom': (300, 150, 550, 380), 'category': 'Pins'},
-            'live_chart': {'class': LiveChartWidget, 'title': 'Live Pin-Verlauf', 'icon': '📈', 'geom': (300, 540, 550, 260), 'category': 'Visualisierung', 'init_args': {'title': 'Live Pin-Verlauf'}},
-            'sequence_info': {'class': SequenceInfoWidget, 'title': 'Testlauf-Status', 'icon': '⏱️', 'geom': (860, 10, 400, 300), 'category': 'Automatisierung'},
+            'connection': WidgetDefinition(ConnectionWidget, 'Verbindung', '🔌', (10, 10, 280, 220), 'Basis'),
+            'quick_sequence': WidgetDefinition(QuickSequenceWidget, 'Schnellstart', '⚙️', (10, 240, 280, 200), 'Basis'),
+            'activity': WidgetDefinition(RecentActivityWidget, 'Aktivitäten', '🕒', (10, 450, 280, 200), 'Basis'),
+            'sensor_display': WidgetDefinition(SensorDisplayWidget, 'Live Sensoren', '🌡️', (300, 10, 280, 130), 'Sensoren'),
+            'pin_overview': WidgetDefinition(PinOverviewWidget, 'Pin Übersicht', '📊', (300, 150, 550, 380), 'Pins'),
+            'live_chart': WidgetDefinition(LiveChartWidget, 'Live Pin-Verlauf', '📈', (300, 540, 550, 260), 'Visualisierung', {'title': 'Live Pin-Verlauf'}),
+            'sequence_info': WidgetDefinition(SequenceInfoWidget, 'Testlauf-Status', '⏱️', (860, 10, 400, 300), 'Automatisierung'),
             # REMOVED: 'led_matrix': { ... }
             # REMOVED: 'pwm_quick': { ... }
         }
@@ -92,17 +110,21 @@ class EnhancedDashboardTab(QWidget):
         }
         self.visible_widgets = self.default_visible.copy()
 
-        self.setup_ui()
-        self._create_widgets()
-        self.setup_connections() # Diese Methode verbindet nur die noch vorhandenen Widgets
+        self._pending_geometry = {}  # Geometrien noch nicht erstellter Widgets aus geladenen Layouts
+        # Widget-ID -> Funktionen, die beim Erstellen des Widgets dessen Signale verbinden (siehe on_widget_created)
+        self._widget_connectors = {'connection': [self._connect_connection_widget],
+                                   'quick_sequence': [self._connect_quick_sequence_widget]}
+        self._pending_toggle = {}  # Widget-ID -> Sichtbarkeit, gesammelt bis zum nächsten Event-Loop-Durchlauf
+        self._toggle_timer = QTimer(self); self._toggle_timer.setSingleShot(True); self._toggle_timer.setInterval(0)
+        self._toggle_timer.timeout.connect(self._flush_toggles)
 
-    # setup_ui, _create_enhanced_toolbar, _create_widgets, setup_connections,
-    # open_widget_selector, toggle_widget_visibility, add_optional_widget,
-    # show_widget, hide_widget, on_save_layout_clicked, on_delete_layout_clicked,
-    # on_layout_selected, get_current_layout_config, apply_layout,
-    # update_layout_list, reset_layout_to_default
-    # bleiben strukturell gleich, aber greifen auf die reduzierte widget_definitions zu.
-    # Hier werden sie aus Platzgründen weggelassen, die Logik ist wie in der vorherigen Version.
+        # Standard-Layout einmalig vorberechnen; add_optional_widget ergänzt neue Geometrien
+        self._default_config = {'geometry': {name: dict(zip(('x', 'y', 'w', 'h'), d.geom)) for name, d in self.widget_definitions.items()},
+                                'visible_widgets': list(self.default_visible)}
+
+        self.setup_ui()
+        # Widgets werden erst mit dem ersten apply_layout (gespeichertes Layout) oder beim ersten Anzeigen erstellt
+        self._widgets_created = False
 
     def setup_ui(self): # Wie zuvor
         main_layout = QVBoxLayout(self)
@@ -115,24 +137,25 @@ class EnhancedDashboardTab(QWidget):
         self.mdi_area.setStyleSheet("QMdiArea { background-color: transparent; }")
         main_layout.addWidget(self.mdi_area)
 
-    def _create_enhanced_toolbar(self): # Wie zuvor, aber ohne Toggles für entfernte Widgets
+    def _create_enhanced_toolbar(self): # Schnellzugriff als Menü, ohne Toggles für entfernte Widgets
         toolbar_layout = QHBoxLayout()
         widget_group = QGroupBox("Widgets")
         widget_layout = QHBoxLayout(widget_group)
         self.manage_widgets_btn = QPushButton("📦 Widgets verwalten")
         self.manage_widgets_btn.clicked.connect(self.open_widget_selector)
         widget_layout.addWidget(self.manage_widgets_btn)
-        self.quick_toggles = {}
-        important_widgets = ['pin_overview', 'live_chart', 'sensor_display', 'sequence_info'] # Ohne led_matrix, pwm_quick
-        for widget_id in important_widgets:
-            if widget_id in self.widget_definitions:
-                info = self.widget_definitions[widget_id]
-                toggle = QCheckBox(info['icon'])
-                toggle.setToolTip(f"{info['title']} ein/ausblenden")
-                toggle.setChecked(widget_id in self.visible_widgets)
-                toggle.stateChanged.connect(lambda state, wid=widget_id: self.toggle_widget_visibility(wid, state))
-                self.quick_toggles[widget_id] = toggle
-                widget_layout.addWidget(toggle)
+        self.quick_toggles = {}  # Widget-ID -> ankreuzbare QAction im Schnellzugriff-Menü
+        toggle_btn = QToolButton(); toggle_btn.setText("👁️ Schnellzugriff"); toggle_btn.setToolTip("Widgets ein/ausblenden")
+        toggle_btn.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
+        toggle_menu = QMenu(toggle_btn); toggle_btn.setMenu(toggle_menu)  # Menü wird erst beim Öffnen gelayoutet
+        for widget_id in self.IMPORTANT_WIDGETS:
+            info = self.widget_definitions.get(widget_id)
+            if info is None: continue
+            action = toggle_menu.addAction(f"{info.icon} {info.title}")
+            action.setCheckable(True); action.setChecked(widget_id in self.visible_widgets)
+            action.toggled.connect(lambda checked, wid=widget_id: self.toggle_widget_visibility(wid, Qt.CheckState.Checked.value if checked else 0))
+            self.quick_toggles[widget_id] = action
+        widget_layout.addWidget(toggle_btn)
         toolbar_layout.addWidget(widget_group)
 
         layout_group = QGroupBox("Layout")
@@ -162,65 +185,112 @@ class EnhancedDashboardTab(QWidget):
         toolbar_layout.addStretch()
         return toolbar_layout
 
-    def _create_widgets(self): # Wie zuvor, erstellt nur noch vorhandene Widgets
-        for name, definition in self.widget_definitions.items():
-            init_args = definition.get('init_args', {})
-            widget_instance = definition['class'](**init_args) if init_args else definition['class']()
-            setattr(self, f"{name}_widget", widget_instance)
-            sub_window = QMdiSubWindow(); sub_window.setWidget(widget_instance)
-            sub_window.setWindowTitle(f"{definition['icon']} {definition['title']}")
-            sub_window.setGeometry(*definition['geom']); sub_window.setObjectName(name)
-            self.mdi_area.addSubWindow(sub_window)
-            sub_window.setVisible(name in self.visible_widgets)
-            self.widgets[name] = {'window': sub_window, 'widget': widget_instance, 'definition': definition}
-        # Aliase für noch vorhandene Widgets
-        if 'sensor_display' in self.widgets: self.sensor_display_widget = self.widgets['sensor_display']['widget']
-        if 'live_chart' in self.widgets: self.live_chart_widget = self.widgets['live_chart']['widget']
-        if 'pin_overview' in self.widgets: self.pin_overview_widget = self.widgets['pin_overview']['widget']
-        if 'connection' in self.widgets: self.connection_widget = self.widgets['connection']['widget']
-        if 'quick_sequence' in self.widgets: self.quick_sequence_widget = self.widgets['quick_sequence']['widget']
-        if 'activity' in self.widgets: self.activity_widget = self.widgets['activity']['widget']
-        if 'sequence_info' in self.widgets: self.sequence_info_widget = self.widgets['sequence_info']['widget']
-
-    def setup_connections(self): # Wie zuvor, verbindet nur noch vorhandene Widgets
-        if hasattr(self, 'connection_widget'):
-            self.connection_widget.connect_requested.connect(self.connect_requested)
-            self.connection_widget.disconnect_requested.connect(self.disconnect_requested)
-            self.connection_widget.refresh_ports_requested.connect(self.refresh_ports_requested)
-        if hasattr(self, 'quick_sequence_widget'):
-            self.quick_sequence_widget.start_sequence_signal.connect(self.start_sequence_signal)
-            self.quick_sequence_widget.start_test_run_signal.connect(self.start_test_run_signal)
-
-    def open_widget_selector(self): # Wie zuvor
+    def _create_widgets(self): # Erstellt nur die sichtbaren Widgets, der Rest folgt bei Bedarf
+        self._widgets_created = True
+        for name in self.widget_definitions:
+            if name in self.visible_widgets: self._ensure_widget(name)
+
+    def showEvent(self, event): # Ohne vorher angewendetes Layout: Standard-Widgets beim ersten Anzeigen erstellen
+        if not self._widgets_created: self._create_widgets()
+        super().showEvent(event)
+
+    def __getattr__(self, name):
+        """Erstellt noch nicht angelegte Widgets beim ersten Zugriff auf `<id>_widget`."""
+        # Nur Fehlschläge der normalen Suche landen hier; _ensure_widget legt das Attribut an,
+        # weitere Zugriffe treffen direkt das Instanz-Dict
+        definitions = self.__dict__.get('widget_definitions')
+        if definitions is not None and name.endswith('_widget') and name[:-7] in definitions:
+            return self._ensure_widget(name[:-7])['widget']
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def get_widget_if_created(self, widget_id):
+        """Liefert das Widget ohne es anzulegen; None, solange es noch nicht erstellt wurde (für Pfade pro Datenpaket)."""
+        widget_data = self.widgets.get(widget_id)
+        return widget_data['widget'] if widget_data is not None else None
+
+    def on_widget_created(self, widget_id, connector):
+        """Ruft connector(widget) auf, sobald das Widget existiert – sofort, falls es bereits erstellt wurde."""
+        self._widget_connectors.setdefault(widget_id, []).append(connector)
+        widget = self.get_widget_if_created(widget_id)
+        if widget is not None: connector(widget)
+
+    def _ensure_widget(self, name):
+        """Liefert die Widget-Daten und erstellt Widget samt Unterfenster beim ersten Zugriff.
+
+        Stellt ein Widget ein Attribut `opengl_window` (QWindow, z.B. QOpenGLWindow) bereit, wird
+        dieses über QWidget.createWindowContainer als native Fläche eingebettet statt das Widget
+        selbst durch den Raster-Malpfad der MDI-Fläche zu komponieren.
+        """
+        widget_data = self.widgets.get(name)
+        if widget_data is not None: return widget_data
+        definition = self.widget_definitions[name]
+        init_args = definition.init_args
+        widget_instance = definition.cls(**init_args) if init_args else definition.cls()
+        setattr(self, f"{name}_widget", widget_instance)
+        opengl_window = getattr(widget_instance, 'opengl_window', None)
+        content = QWidget.createWindowContainer(opengl_window) if opengl_window is not None else widget_instance
+        sub_window = QMdiSubWindow(); sub_window.setWidget(content)
+        sub_window.setWindowTitle(f"{definition.icon} {definition.title}")
+        sub_window.setObjectName(name); self.mdi_area.addSubWindow(sub_window)
+        sub_window.setGeometry(*self._pending_geometry.pop(name, definition.geom))  # Nach addSubWindow, sonst platziert QMdiArea nachträglich erstellte Fenster selbst
+        sub_window.setVisible(name in self.visible_widgets)
+        widget_data = self.widgets[name] = {'window': sub_window, 'widget': widget_instance, 'definition': definition}
+        for connector in self._widget_connectors.get(name, ()): connector(widget_instance)
+        return widget_data
+
+    def _connect_connection_widget(self, widget):
+        widget.connect_requested.connect(self.connect_requested)
+        widget.disconnect_requested.connect(self.disconnect_requested)
+        widget.refresh_ports_requested.connect(self.refresh_ports_requested)
+
+    def _connect_quick_sequence_widget(self, widget):
+        widget.start_sequence_signal.connect(self.start_sequence_signal)
+        widget.start_test_run_signal.connect(self.start_test_run_signal)
+
+    def open_widget_selector(self):
         dialog = WidgetSelectorDialog(self.widget_definitions, self.visible_widgets, self)
         if dialog.exec():
-            new_visible = dialog.get_selected_widgets()
-            for widget_id in self.widget_definitions.keys():
-                should_be_visible = widget_id in new_visible
-                is_currently_visible = widget_id in self.visible_widgets
-                if should_be_visible != is_currently_visible: self.widgets[widget_id]['window'].setVisible(should_be_visible)
+            new_visible = dialog.get_selected_widgets(); self._pending_toggle.clear()  # Auswahl ersetzt offene Umschaltungen
+            to_show = new_visible - self.visible_widgets; to_hide = self.visible_widgets - new_visible  # Nur tatsächlich geänderte Fenster anfassen
+            self.mdi_area.setUpdatesEnabled(False)
+            try:
+                for widget_id in to_show: self._ensure_widget(widget_id)['window'].setVisible(True)
+                for widget_id in to_hide:
+                    if widget_id in self.widgets: self.widgets[widget_id]['window'].setVisible(False)
+            finally:
+                self.mdi_area.setUpdatesEnabled(True)
             self.visible_widgets = new_visible
-            for widget_id, toggle in self.quick_toggles.items():
-                toggle.blockSignals(True); toggle.setChecked(widget_id in self.visible_widgets); toggle.blockSignals(False)
-
-    def toggle_widget_visibility(self, widget_id, state): # Wie zuvor
-        is_visible = (state == Qt.CheckState.Checked.value)
-        if widget_id in self.widgets:
-            self.widgets[widget_id]['window'].setVisible(is_visible)
-            if is_visible: self.visible_widgets.add(widget_id)
-            else: self.visible_widgets.discard(widget_id)
-
-    def add_optional_widget(self, widget_id, title, icon, widget_instance, geometry, category='Erweitert'): # Wie zuvor
+            for widget_id in (to_show | to_hide) & self.quick_toggles.keys():
+                toggle = self.quick_toggles[widget_id]
+                with QSignalBlocker(toggle): toggle.setChecked(widget_id in new_visible)
+
+    def toggle_widget_visibility(self, widget_id, state): # Sammelt Umschaltungen, _flush_toggles wendet sie gebündelt an
+        if widget_id in self.widget_definitions:
+            self._pending_toggle[widget_id] = (state == Qt.CheckState.Checked.value); self._toggle_timer.start()
+
+    def _flush_toggles(self):
+        self.mdi_area.setUpdatesEnabled(False)
+        try:
+            for widget_id, is_visible in self._pending_toggle.items():
+                if is_visible: self._ensure_widget(widget_id)
+                if widget_id in self.widgets: self.widgets[widget_id]['window'].setVisible(is_visible)
+                if is_visible: self.visible_widgets.add(widget_id)
+                else: self.visible_widgets.discard(widget_id)
+        finally:
+            self._pending_toggle.clear(); self.mdi_area.setUpdatesEnabled(True)
+
+    def add_optional_widget(self, widget_id, title, icon, widget_instance, geometry, category='Erweitert'):
         if widget_id in self.widget_definitions: print(f"⚠️ Widget '{widget_id}' existiert bereits!"); return False
-        self.widget_definitions[widget_id] = {'class': widget_instance.__class__, 'title': title, 'icon': icon, 'geom': geometry, 'category': category}
+        self.widget_definitions[widget_id] = WidgetDefinition(widget_instance.__class__, title, icon, geometry, category)
+        self._default_config['geometry'][widget_id] = dict(zip(('x', 'y', 'w', 'h'), geometry))
         sub_window = QMdiSubWindow(); sub_window.setWidget(widget_instance); sub_window.setWindowTitle(f"{icon} {title}"); sub_window.setGeometry(*geometry); sub_window.setObjectName(widget_id)
         self.mdi_area.addSubWindow(sub_window); sub_window.setVisible(False)
         self.widgets[widget_id] = {'window': sub_window, 'widget': widget_instance, 'definition': self.widget_definitions[widget_id]}
         setattr(self, f"{widget_id}_widget", widget_instance)
         print(f"✅ Widget '{title}' zum Dashboard hinzugefügt!"); return True
 
-    def show_widget(self, widget_id): # Wie zuvor
-        if widget_id in self.widgets: self.widgets[widget_id]['window'].show(); self.visible_widgets.add(widget_id)
+    def show_widget(self, widget_id):
+        if widget_id in self.widget_definitions: self._ensure_widget(widget_id)['window'].show(); self.visible_widgets.add(widget_id)
 
     def hide_widget(self, widget_id): # Wie zuvor
         if widget_id in self.widgets: self.widgets[widget_id]['window'].hide(); self.visible_widgets.discard(widget_id)
@@ -237,34 +307,50 @@ class EnhancedDashboardTab(QWidget):
     def on_layout_selected(self, name): # Wie zuvor
         if name: self.layout_load_requested.emit(name)
 
-    def get_current_layout_config(self): # Wie zuvor
-        layout_config = {'geometry': {}, 'visible_widgets': list(self.visible_widgets)}
-        for widget_id, widget_data in self.widgets.items():
-            geom = widget_data['window'].geometry()
-            layout_config['geometry'][widget_id] = {'x': geom.x(), 'y': geom.y(), 'w': geom.width(), 'h': geom.height()}
-        return layout_config
-
-    def apply_layout(self, layout_config): # Wie zuvor
-        geometry = layout_config.get('geometry', {})
-        for widget_id, geom_data in geometry.items():
-            if widget_id in self.widgets: self.widgets[widget_id]['window'].setGeometry(geom_data['x'], geom_data['y'], geom_data['w'], geom_data['h'])
-        visible = set(layout_config.get('visible_widgets', self.default_visible))
-        self.visible_widgets = visible
-        for widget_id, widget_data in self.widgets.items(): widget_data['window'].setVisible(widget_id in visible)
-        for widget_id, toggle in self.quick_toggles.items():
-            toggle.blockSignals(True); toggle.setChecked(widget_id in visible); toggle.blockSignals(False)
-
-    def update_layout_list(self, layout_names): # Wie zuvor
-        self.layout_combo.blockSignals(True); current = self.layout_combo.currentText(); self.layout_combo.clear(); self.layout_combo.addItems(layout_names)
-        if current in layout_names: self.layout_combo.setCurrentText(current)
-        self.layout_combo.blockSignals(False)
-
-    def reset_layout_to_default(self): # Wie zuvor
-        default_config = {
-            'geometry': {name: {'x': d['geom'][0], 'y': d['geom'][1], 'w': d['geom'][2], 'h': d['geom'][3]} for name, d in self.widget_definitions.items()},
-            'visible_widgets': list(self.default_visible)
-        }
-        self.apply_layout(default_config)
+    def get_current_layout_config(self): # Unverändertes Layout wird aus dem zuletzt erzeugten Dict kopiert
+        # Noch nicht erstellte Widgets mit vorgemerkter bzw. Standard-Geometrie
+        rects = tuple((widget_id, self.widgets[widget_id]['window'].geometry().getRect() if widget_id in self.widgets else self._pending_geometry.get(widget_id, definition.geom))
+                      for widget_id, definition in self.widget_definitions.items())
+        snapshot = (rects, frozenset(self.visible_widgets))
+        if snapshot != self._last_layout_snapshot:
+            self._last_layout_config = {'geometry': {widget_id: {'x': x, 'y': y, 'w': w, 'h': h} for widget_id, (x, y, w, h) in rects},
+                                        'visible_widgets': list(self.visible_widgets)}
+            self._last_layout_snapshot = snapshot
+        # Kopie zurückgeben: main.py legt das Ergebnis unter mehreren Layout-Namen ab, Änderungen dürfen den Cache nicht treffen
+        cached = self._last_layout_config
+        return {'geometry': {widget_id: geom.copy() for widget_id, geom in cached['geometry'].items()},
+                'visible_widgets': cached['visible_widgets'].copy()}
+
+    def apply_layout(self, layout_config):
+        # Alle Geometrie-/Sichtbarkeitsänderungen in einem Repaint der MDI-Fläche zusammenfassen
+        self.mdi_area.setUpdatesEnabled(False)
+        try:
+            geometry = layout_config.get('geometry', {})
+            visible = set(layout_config.get('visible_widgets', self.default_visible))
+            self.visible_widgets = visible; self._pending_toggle.clear()  # Layout ersetzt offene Umschaltungen
+            for widget_id, geom_data in geometry.items():  # Verborgene, noch nicht erstellte Widgets übernehmen die Geometrie später
+                if widget_id not in self.widgets and widget_id not in visible and widget_id in self.widget_definitions:
+                    self._pending_geometry[widget_id] = (geom_data['x'], geom_data['y'], geom_data['w'], geom_data['h'])
+            self._widgets_created = True  # Sichtbarkeit des Layouts statt des Standard-Satzes
+            for widget_id in visible & self.widget_definitions.keys(): self._ensure_widget(widget_id)
+            for widget_id, widget_data in self.widgets.items():  # Geometrie und Sichtbarkeit in einem Durchlauf
+                win = widget_data['window']; geom_data = geometry.get(widget_id)
+                with QSignalBlocker(win):
+                    if geom_data: win.setGeometry(geom_data['x'], geom_data['y'], geom_data['w'], geom_data['h'])
+                    win.setVisible(widget_id in visible)
+            for widget_id, toggle in self.quick_toggles.items():
+                with QSignalBlocker(toggle): toggle.setChecked(widget_id in visible)
+        finally:
+            self.mdi_area.setUpdatesEnabled(True)  # Plant selbst genau ein update() der MDI-Fläche ein
+
+    def update_layout_list(self, layout_names):
+        if [self.layout_combo.itemText(i) for i in range(self.layout_combo.count())] == list(layout_names): return  # Unverändert
+        with QSignalBlocker(self.layout_combo):
+            current = self.layout_combo.currentText(); self.layout_combo.clear(); self.layout_combo.addItems(layout_names)
+            if current in layout_names: self.layout_combo.setCurrentText(current)
+
+    def reset_layout_to_default(self): # Mit dem in __init__ vorberechneten Standard-Layout
+        self.apply_layout(self._default_config)
 
     def toggle_edit_mode(self):
         """Schaltet zwischen Edit Mode (bewegliche Widgets) und View Mode (gesperrte Widgets) um"""
@@ -187,7 +187,7 @@ class SensorTab(QWidget):
 
         # NEU: Kalibrierungs-Manager
         if CALIBRATION_AVAILABLE:
-            self.calibration_manager = CalibrationManager()
+            self.calibration_manager = CalibrationManager.instance()
             # Verbinde Kalibrierungs-Signale
             self.b24_sensor.calibrate_requested.connect(self.open_calibration_wizard)
             # Lade Kalibrierungs-Status
@@ -368,6 +368,7 @@ class SensorTab(QWidget):
             sensor_id=sensor_id,
             sensor_name=sensor_name,
             current_value_callback=get_current_value,
+            calibration_manager=self.calibration_manager,
             parent=self
         )
 